@@ -121,6 +121,8 @@ const char* osrfLogGetXid( void );
 
 void osrfLogSetActivityEnabled( int enabled );
 
+int osrfLogActivityWouldLog( void );
+
 int osrfLogFacilityToInt( const char* facility );
 
 #ifdef __cplusplus
@@ -176,6 +176,12 @@ unsigned long jsonObjectSetKey(
 char* jsonObjectToJSON( const jsonObject* obj );
 char* jsonObjectToJSONRaw( const jsonObject* obj );
 
+/*
+ * Turns the object into an indented JSON string in a single pass,
+ * equivalent to jsonObjectToJSON() followed by jsonFormatString().
+ * The string must be freed by the caller */
+char* jsonObjectToJSONPretty( const jsonObject* obj );
+
 jsonObject* jsonObjectGetKey( jsonObject* obj, const char* key );
 
 const jsonObject* jsonObjectGetKeyConst( const jsonObject* obj, const char* key );
@@ -1,11 +1,12 @@
 #include "apachetools.h"
 
-osrfStringArray* apacheParseParms(request_rec* r) {
+/* Reads the request into a growing_buffer: the URL query string
+   followed by any POST data.  Returns NULL if the request carried no
+   params.  The caller frees the buffer. */
+static growing_buffer* apacheReadParamData(request_rec* r) {
 
 	if( r == NULL ) return NULL;
 
-	char* arg = NULL;
-	apr_pool_t *p = r->pool;	/* memory pool */
 	growing_buffer* buffer = buffer_init(1025);
 
 	/* gather the post args and append them to the url query string */
@@ -28,18 +29,19 @@ osrfStringArray* apacheParseParms(request_rec* r) {
 			osrfLogDebug(OSRF_LOG_MARK, "gateway client has post data, reading...");
 
 			/* Append POST data */
-			
+
 			long bread;
 			while( (bread = ap_get_client_block(r, body, sizeof(body) - 1)) ) {
 
 				if(bread < 0) {
-					osrfLogInfo(OSRF_LOG_MARK, 
+					osrfLogInfo(OSRF_LOG_MARK,
 						"ap_get_client_block(): returned error, exiting POST reader");
 					break;
 				}
 
-				body[bread] = '\0';
-				buffer_add( buffer, body );
+				/* we know how many bytes we read; no need to NUL-terminate
+				   and re-measure the chunk */
+				buffer_add_n( buffer, body, bread );
 
 				osrfLogDebug(OSRF_LOG_MARK, 
 					"gateway read %ld bytes: %d bytes of data so far", bread, buffer->n_used);
@@ -62,16 +64,25 @@ osrfStringArray* apacheParseParms(request_rec* r) {
     }
 
 
-    if(buffer->n_used > 0)
-        arg = apr_pstrdup(p, buffer->buf);
-    else
-        arg = NULL; 
-    buffer_free(buffer);
-
-	if( !arg || !arg[0] ) { /* we received no request */
+	if( buffer->n_used < 1 ) { /* we received no request */
+		buffer_free(buffer);
 		return NULL;
 	}
 
+	return buffer;
+}
+
+osrfStringArray* apacheParseParms(request_rec* r) {
+
+	apr_pool_t *p = r ? r->pool : NULL;	/* memory pool */
+	growing_buffer* buffer = apacheReadParamData(r);
+	if( buffer == NULL ) return NULL;
+
+	/* parse the buffer in place; ap_getword() copies each name and
+	   value into the pool, so there is no need to duplicate the whole
+	   body into the pool first */
+	char* arg = buffer->buf;
+
 	osrfLogDebug(OSRF_LOG_MARK, "parsing URL params from post/get request data: %s", arg);
 	
 	osrfStringArray* sarray		= osrfNewStringArray(12); /* method parameters */
@@ -98,14 +109,17 @@ osrfStringArray* apacheParseParms(request_rec* r) {
 		osrfStringArrayAdd(sarray, val);
 
 		if( sanity++ > 1000 ) {
-			osrfLogError(OSRF_LOG_MARK, 
+			osrfLogError(OSRF_LOG_MARK,
 				"Parsing URL params failed sanity check: 1000 iterations");
 			osrfStringArrayFree(sarray);
+			buffer_free(buffer);
 			return NULL;
 		}
 
 	}
 
+	buffer_free(buffer);
+
 	osrfLogDebug(OSRF_LOG_MARK,
 		"Apache tools parsed %d params key/values", sarray->size / 2 );
 
@@ -113,6 +127,42 @@ osrfStringArray* apacheParseParms(request_rec* r) {
 }
 
 
+char* apacheScanFirstParamValue(request_rec* r, const char* key) {
+
+	if( r == NULL || key == NULL ) return NULL;
+
+	growing_buffer* buffer = apacheReadParamData(r);
+	if( buffer == NULL ) return NULL;
+
+	/* walk the pairs, but only URL-decode the one value we were asked
+	   for; everything else is skipped without the decode or the
+	   key/value array bookkeeping of apacheParseParms() */
+	char* arg = buffer->buf;
+	char* val = NULL;
+	char* pair = NULL;
+	size_t keylen = strlen(key);
+	int sanity = 0;
+
+	while( arg && (pair = ap_getword(r->pool, (const char**) &arg, '&')) && pair[0] ) {
+
+		if( !strncmp(pair, key, keylen) && pair[keylen] == '=' ) {
+			ap_unescape_url(pair + keylen + 1);
+			val = strdup(pair + keylen + 1);
+			break;
+		}
+
+		if( sanity++ > 1000 ) {
+			osrfLogError(OSRF_LOG_MARK,
+				"Scanning URL params failed sanity check: 1000 iterations");
+			break;
+		}
+	}
+
+	buffer_free(buffer);
+	return val;
+}
+
+
 
 osrfStringArray* apacheGetParamKeys(osrfStringArray* params) {
 	if(params == NULL) return NULL;	
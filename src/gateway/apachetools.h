@@ -40,10 +40,16 @@ osrfStringArray* apacheGetParamKeys(osrfStringArray* params);
 	*/
 osrfStringArray* apacheGetParamValues(osrfStringArray* params, char* key);
 
-/* returns the first value found for the given param.  
+/* returns the first value found for the given param.
 	char* must be freed by the caller */
 char* apacheGetFirstParamValue(osrfStringArray* params, char* key);
 
+/* reads the request and returns the first value found for the given
+	param, URL-decoding only that value instead of every field.
+	For callers interested in a single param this avoids building
+	the full key/value array.  char* must be freed by the caller */
+char* apacheScanFirstParamValue(request_rec* r, const char* key);
+
 /* Writes msg to stderr, flushes stderr, and returns 0 */
 int apacheDebug( char* msg, ... );
 
@@ -43,6 +43,14 @@ char* routerName = NULL;
 char* domainName = NULL;
 int osrfConnected = 0;
 char recipientBuf[128];
+int recipientPrefixLen = 0; // length of the "router@domain/" prefix in recipientBuf
+
+// per-child cache of the most recently seen session; see
+// translatorSessionStore/Fetch/Drop below
+#define LOCAL_SESSION_CACHE_TIME 30
+static char localSessionThread[256] = "";
+static jsonObject* localSessionObj = NULL;
+static time_t localSessionExpires = 0;
 char contentTypeBuf[80];
 osrfStringArray* allowedOrigins = NULL;
 
@@ -125,24 +133,26 @@ static osrfHttpTranslator* osrfNewHttpTranslator(request_rec* apreq) {
 #endif
     trans->messages = NULL;
 
-    /* load the message body */
-    osrfStringArray* params	= apacheParseParms(apreq);
-    trans->body = apacheGetFirstParamValue(params, "osrf-msg");
-    osrfStringArrayFree(params);
+    /* load the message body; only the osrf-msg field matters here, so
+       scan for it directly rather than decoding every param */
+    trans->body = apacheScanFirstParamValue(apreq, "osrf-msg");
 
-    /* load the request headers */
-    if (apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_XID))
+    /* load the request headers, fetching each header only once */
+    const char* xid = apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_XID);
+    if (xid)
         // force our log xid to match the caller
-        osrfLogForceXid(strdup(apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_XID)));
+        osrfLogForceXid(strdup(xid));
 
     trans->handle = osrfSystemGetTransportClient();
     trans->recipient = apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_TO);
     trans->service = apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_SERVICE);
 
+    // interpret the timeout header once here; the receive loop reuses
+    // the numeric value.  a missing or malformed header falls back to
+    // the default rather than a zero/negative wait
     const char* timeout = apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_TIMEOUT);
-    if(timeout) 
-        trans->timeout = atoi(timeout);
-    else 
+    trans->timeout = timeout ? atoi(timeout) : DEFAULT_TRANSLATOR_TIMEOUT;
+    if(trans->timeout <= 0)
         trans->timeout = DEFAULT_TRANSLATOR_TIMEOUT;
 
     const char* multipart = apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_MULTIPART);
@@ -151,14 +161,17 @@ static osrfHttpTranslator* osrfNewHttpTranslator(request_rec* apreq) {
     else
         trans->multipart = 0;
 
-    char buf[32];
-    snprintf(buf, sizeof(buf), "%d%ld", getpid(), time(NULL));
-    trans->delim = md5sum(buf);
+    // the delimiter only needs to be unique per request; pid + time +
+    // a per-process sequence gets us that without hashing anything
+    static unsigned long delimSeq = 0;
+    char buf[64];
+    snprintf(buf, sizeof(buf), "%x%lx%lx",
+        (unsigned int) getpid(), (unsigned long) time(NULL), delimSeq++);
+    trans->delim = strdup(buf);
 
     /* Use thread if it has been passed in; otherwise, just use the delimiter */
-    trans->thread = apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_THREAD)
-        ?  apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_THREAD)
-        : (const char*)trans->delim;
+    const char* thread = apr_table_get(apreq->headers_in, OSRF_HTTP_HEADER_THREAD);
+    trans->thread = thread ? thread : (const char*)trans->delim;
 
     return trans;
 }
@@ -185,8 +198,51 @@ static void osrfHttpTranslatorDebug(osrfHttpTranslator* trans) {
 #endif
 
 /**
- * Determines the correct recipient address based on the requested 
- * service or recipient address.  
+ * Stows a session object in the per-child cache, taking ownership of obj.
+ * Stateful conversations tend to return to the same child in quick
+ * succession, so remembering the last session seen lets repeat requests
+ * skip a memcached round trip.  Entries expire quickly and are dropped
+ * whenever the distributed cache entry is removed.
+ */
+static void translatorSessionStore(const char* thread, jsonObject* obj) {
+    jsonObjectFree(localSessionObj);
+    localSessionObj = NULL;
+    localSessionThread[0] = '\0';
+    if(strlen(thread) < sizeof(localSessionThread)) {
+        localSessionObj = obj;
+        strcpy(localSessionThread, thread);
+        localSessionExpires = time(NULL) + LOCAL_SESSION_CACHE_TIME;
+    } else {
+        jsonObjectFree(obj); // thread too long to cache locally
+    }
+}
+
+/**
+ * Returns the session object for the given thread, consulting the
+ * per-child cache before memcached.  The caller owns the result.
+ */
+static jsonObject* translatorSessionFetch(const char* thread) {
+    if(localSessionObj && time(NULL) <= localSessionExpires
+            && !strcmp(localSessionThread, thread))
+        return jsonObjectClone(localSessionObj);
+    return osrfCacheGetObject(thread);
+}
+
+/**
+ * Removes the session for the given thread from both caches.
+ */
+static void translatorSessionDrop(const char* thread) {
+    if(localSessionObj && !strcmp(localSessionThread, thread)) {
+        jsonObjectFree(localSessionObj);
+        localSessionObj = NULL;
+        localSessionThread[0] = '\0';
+    }
+    osrfCacheRemove(thread);
+}
+
+/**
+ * Determines the correct recipient address based on the requested
+ * service or recipient address.
  */
 static int osrfHttpTranslatorSetTo(osrfHttpTranslator* trans) {
     int stat = 0;
@@ -197,11 +253,11 @@ static int osrfHttpTranslatorSetTo(osrfHttpTranslator* trans) {
             osrfLogError(OSRF_LOG_MARK, "Specifying both SERVICE and TO are not allowed");
 
         } else {
-            // service is specified, build a recipient address 
-            // from the router, domain, and service
-            int size = snprintf(recipientBuf, 128, "%s@%s/%s", routerName,
-                domainName, trans->service);
-            recipientBuf[size] = '\0';
+            // service is specified; the "router@domain/" prefix was
+            // formatted once at child init, so only the service name
+            // needs to be appended per request
+            snprintf(recipientBuf + recipientPrefixLen,
+                sizeof(recipientBuf) - recipientPrefixLen, "%s", trans->service);
             osrfLogDebug(OSRF_LOG_MARK, "Set recipient to %s", recipientBuf);
             trans->recipient = recipientBuf;
             stat = 1;
@@ -210,7 +266,7 @@ static int osrfHttpTranslatorSetTo(osrfHttpTranslator* trans) {
     } else {
 
         if(trans->recipient) {
-            sessionCache = osrfCacheGetObject(trans->thread);
+            sessionCache = translatorSessionFetch(trans->thread);
 
             if(sessionCache) {
                 const char* ipAddr = jsonObjectGetString(
@@ -248,8 +304,14 @@ static int osrfHttpTranslatorSetTo(osrfHttpTranslator* trans) {
 
 /**
  * Parses the request body, logs any REQUEST messages to the activity log, 
- * stamps the translator ingress on each message, and returns the updated 
+ * stamps the translator ingress on each message, and returns the updated
  * messages as a JSON string.
+ *
+ * Note that even a trivial single-DISCONNECT body takes the full parse:
+ * whatever is forwarded to the backend must carry the translator ingress
+ * stamp, and that requires deserializing and re-serializing the batch.
+ * A substring sniff (as used for responses in CheckStatus below) would
+ * forward unstamped messages.
  */
 static char* osrfHttpTranslatorParseRequest(osrfHttpTranslator* trans) {
     osrfMessage* msg;
@@ -269,8 +331,13 @@ static char* osrfHttpTranslatorParseRequest(osrfHttpTranslator* trans) {
         switch(msg->m_type) {
 
             case REQUEST: {
+                // don't stringify the params unless the activity line
+                // would actually be logged
+                if( !osrfLogActivityWouldLog() )
+                    break;
+
                 const jsonObject* params = msg->_params;
-                growing_buffer* act = buffer_init(128);	
+                growing_buffer* act = buffer_init(128);
                 char* method = msg->method_name;
                 buffer_fadd(act, "[%s] [%s] %s %s", trans->remoteHost, "",
                     trans->service, method);
@@ -340,32 +407,46 @@ static char* osrfHttpTranslatorParseRequest(osrfHttpTranslator* trans) {
 }
 
 static int osrfHttpTranslatorCheckStatus(osrfHttpTranslator* trans, transport_message* msg) {
+
+    // STATUS messages serialize with a literal "STATUS" type marker.  If
+    // the raw body doesn't contain that substring there is nothing here
+    // for us to act on, so skip the full parse; bodies that do contain
+    // it (possibly only inside a payload) get inspected properly below.
+    if(msg->body && strstr(msg->body, "STATUS") == NULL)
+        return 1;
+
     osrfMessage* omsgList[MAX_MSGS_PER_PACKET];
     int numMsgs = osrf_message_deserialize(msg->body, omsgList, MAX_MSGS_PER_PACKET);
     osrfLogDebug(OSRF_LOG_MARK, "parsed %d response messages", numMsgs);
     if(numMsgs == 0) return 0;
 
+    int stat = 1;
     osrfMessage* last = omsgList[numMsgs-1];
     if(last->m_type == STATUS) {
         if(last->status_code == OSRF_STATUS_TIMEOUT) {
             osrfLogDebug(OSRF_LOG_MARK, "removing cached session on request timeout");
-            osrfCacheRemove(trans->thread);
-            return 0;
+            translatorSessionDrop(trans->thread);
+            stat = 0;
         }
         // XXX hm, check for explicit status=COMPLETE message instead??
-        if(last->status_code != OSRF_STATUS_CONTINUE)
+        else if(last->status_code != OSRF_STATUS_CONTINUE)
             trans->complete = 1;
     }
 
-    return 1;
+    // this parse is only for status inspection; the raw message body is
+    // what gets relayed to the caller, so release the parsed copies
+    int i;
+    for(i = 0; i < numMsgs; i++)
+        osrfMessageFree(omsgList[i]);
+
+    return stat;
 }
 
 static void osrfHttpTranslatorInitHeaders(osrfHttpTranslator* trans, transport_message* msg) {
     apr_table_set(trans->apreq->headers_out, OSRF_HTTP_HEADER_FROM, msg->sender);
     apr_table_set(trans->apreq->headers_out, OSRF_HTTP_HEADER_THREAD, trans->thread);
     if(trans->multipart) {
-        sprintf(contentTypeBuf, MULTIPART_CONTENT_TYPE, trans->delim);
-        contentTypeBuf[79] = '\0';
+        snprintf(contentTypeBuf, sizeof(contentTypeBuf), MULTIPART_CONTENT_TYPE, trans->delim);
         osrfLogDebug(OSRF_LOG_MARK, "content type %s : %s : %s", MULTIPART_CONTENT_TYPE,
         trans->delim, contentTypeBuf);
         ap_set_content_type(trans->apreq, contentTypeBuf);
@@ -384,6 +465,8 @@ static void osrfHttpTranslatorCacheSession(osrfHttpTranslator* trans, const char
     jsonObjectSetKey(cacheObj, "jid", jsonNewObject(jid));
     jsonObjectSetKey(cacheObj, "service", jsonNewObject(trans->service));
     osrfCachePutObject(trans->thread, cacheObj, CACHE_TIME);
+    // hand the object to the per-child cache rather than freeing it
+    translatorSessionStore(trans->thread, cacheObj);
 }
 
 
@@ -392,17 +475,11 @@ static void osrfHttpTranslatorCacheSession(osrfHttpTranslator* trans, const char
  */
 static void osrfHttpTranslatorWriteChunk(osrfHttpTranslator* trans, transport_message* msg) {
     osrfLogInternal(OSRF_LOG_MARK, "sending multipart chunk %s", msg->body);
-    ap_rprintf(trans->apreq, 
-        "Content-type: %s\n\n%s\n\n", JSON_CONTENT_TYPE, msg->body);
-    //osrfLogInternal(OSRF_LOG_MARK, "Apache sending data: Content-type: %s\n\n%s\n\n",
-    //JSON_CONTENT_TYPE, msg->body);
-    if(trans->complete) {
-        ap_rprintf(trans->apreq, "--%s--\n", trans->delim);
-        //osrfLogInternal(OSRF_LOG_MARK, "Apache sending data: --%s--\n", trans->delim);
-    } else {
-        ap_rprintf(trans->apreq, "--%s\n", trans->delim);
-        //osrfLogInternal(OSRF_LOG_MARK, "Apache sending data: --%s\n", trans->delim);
-    }
+    // write the chunk body and its boundary in one pass through the
+    // output filter chain instead of two
+    ap_rprintf(trans->apreq,
+        "Content-type: %s\n\n%s\n\n--%s%s\n", JSON_CONTENT_TYPE, msg->body,
+        trans->delim, trans->complete ? "--" : "");
     ap_rflush(trans->apreq);
 }
 
@@ -417,8 +494,10 @@ static int osrfHttpTranslatorProcess(osrfHttpTranslator* trans) {
     if (NULL == jsonBody)
         return HTTP_BAD_REQUEST;
 
-    while(client_recv(trans->handle, 0))
-        continue; // discard any old status messages in the recv queue
+    // discard any old status messages in the recv queue
+    transport_message* stale;
+    while( (stale = client_recv(trans->handle, 0)) )
+        message_free(stale);
 
     // send the message to the recipient
     transport_message* tmsg = message_init(
@@ -430,7 +509,7 @@ static int osrfHttpTranslatorProcess(osrfHttpTranslator* trans) {
 
     if(trans->disconnectOnly) {
         osrfLogDebug(OSRF_LOG_MARK, "exiting early on disconnect");
-        osrfCacheRemove(trans->thread);
+        translatorSessionDrop(trans->thread);
         return OK;
     }
 
@@ -441,7 +520,7 @@ static int osrfHttpTranslatorProcess(osrfHttpTranslator* trans) {
 
         if(trans->handle->error) {
             osrfLogError(OSRF_LOG_MARK, "Transport error");
-            osrfCacheRemove(trans->thread);
+            translatorSessionDrop(trans->thread);
             return HTTP_INTERNAL_SERVER_ERROR;
         }
 
@@ -450,12 +529,14 @@ static int osrfHttpTranslatorProcess(osrfHttpTranslator* trans) {
 
         if(msg->is_error) {
             osrfLogError(OSRF_LOG_MARK, "XMPP message resulted in error code %d", msg->error_code);
-            osrfCacheRemove(trans->thread);
+            translatorSessionDrop(trans->thread);
             return HTTP_NOT_FOUND;
         }
 
-        if(!osrfHttpTranslatorCheckStatus(trans, msg))
+        if(!osrfHttpTranslatorCheckStatus(trans, msg)) {
+            message_free(msg);
             continue;
+        }
 
         if(firstWrite) {
             osrfHttpTranslatorInitHeaders(trans, msg);
@@ -464,26 +545,50 @@ static int osrfHttpTranslatorProcess(osrfHttpTranslator* trans) {
             firstWrite = 0;
         }
 
+        // if the conversation is over, release the cached session
+        // before writing the remaining output; a slow client write
+        // shouldn't delay freeing the backend for other requests
+        if(trans->complete && trans->disconnecting) {
+            translatorSessionDrop(trans->thread);
+            trans->disconnecting = 0;
+        }
+
         if(trans->multipart) {
             osrfHttpTranslatorWriteChunk(trans, msg);
+            message_free(msg);
             if(trans->connectOnly)
                 break;
         } else {
-            if(!trans->messages)
+            if(!trans->messages) {
                 trans->messages = osrfNewList();
+                // the list takes ownership of the bodies pushed below
+                osrfListSetDefaultFree(trans->messages);
+            }
+            // detach the body and release the rest of the message now,
+            // instead of letting the whole transport_message linger
             osrfListPush(trans->messages, msg->body);
+            msg->body = NULL;
+            message_free(msg);
 
             if(trans->complete || trans->connectOnly) {
-                growing_buffer* buf = buffer_init(128);
                 unsigned int i;
-                OSRF_BUFFER_ADD(buf, osrfListGetIndex(trans->messages, 0));
+
+                // size the buffer for the combined response up front so
+                // large result sets don't trigger repeated realloc/copy
+                // cycles while the bodies are stitched together
+                size_t total = 1;
+                for(i = 0; i < trans->messages->size; i++)
+                    total += strlen(OSRF_LIST_GET_INDEX(trans->messages, i));
+
+                growing_buffer* buf = buffer_init(total);
+                // use the macro accessor; no need for a function call
+                // per message just to index the array
+                OSRF_BUFFER_ADD(buf, OSRF_LIST_GET_INDEX(trans->messages, 0));
                 for(i = 1; i < trans->messages->size; i++) {
                     buffer_chomp(buf); // chomp off the closing array bracket
-                    char* body = osrfListGetIndex(trans->messages, i);
-                    char newbuf[strlen(body)];
-                    sprintf(newbuf, "%s", body+1); // chomp off the opening array bracket
+                    char* body = OSRF_LIST_GET_INDEX(trans->messages, i);
                     OSRF_BUFFER_ADD_CHAR(buf, ',');
-                    OSRF_BUFFER_ADD(buf, newbuf);
+                    OSRF_BUFFER_ADD(buf, body + 1); // skip the opening array bracket
                 }
 
                 ap_rputs(buf->buf, trans->apreq);
@@ -493,7 +598,7 @@ static int osrfHttpTranslatorProcess(osrfHttpTranslator* trans) {
     }
 
     if(trans->disconnecting) // DISCONNECT within a multi-message batch
-        osrfCacheRemove(trans->thread);
+        translatorSessionDrop(trans->thread);
 
     return OK;
 }
@@ -525,6 +630,14 @@ static void childInit(apr_pool_t *p, server_rec *s) {
 
     routerName = osrfConfigGetValue(NULL, "/router_name");
     domainName = osrfConfigGetValue(NULL, "/domain");
+
+    // the router and domain never change for the life of the child, so
+    // build the recipient address prefix once; per-request code appends
+    // only the service name
+    recipientPrefixLen = snprintf(recipientBuf, sizeof(recipientBuf),
+        "%s@%s/", routerName, domainName);
+    if(recipientPrefixLen < 0 || recipientPrefixLen >= (int) sizeof(recipientBuf))
+        recipientPrefixLen = 0; // overlong config; fall back to an empty prefix
     const char* servers[] = {cacheServers};
     osrfCacheInit(servers, 1, 86400);
 	osrfConnected = 1;
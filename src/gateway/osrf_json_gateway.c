@@ -78,11 +78,10 @@ static apr_status_t child_exit(void* data) {
 static void osrf_json_gateway_child_init(apr_pool_t *p, server_rec *s) {
 
 	char* cfg = osrf_json_gateway_config_file;
-	char buf[32];
-	int t = time(NULL);
-	snprintf(buf, sizeof(buf), "%d", t);
 
-	if( ! osrfSystemBootstrapClientResc( cfg, CONFIG_CONTEXT, buf ) ) {
+	/* the bootstrap routine appends hostname, time and pid to the
+	   resource name; a fixed label is all we need to contribute */
+	if( ! osrfSystemBootstrapClientResc( cfg, CONFIG_CONTEXT, "gateway" ) ) {
 		ap_log_error( APLOG_MARK, APLOG_ERR, 0, s,
 			"Unable to Bootstrap OpenSRF Client with config %s..", cfg);
 		return;
@@ -153,13 +152,37 @@ static int osrf_json_gateway_method_handler (request_rec *r) {
 	osrfLogDebug(OSRF_LOG_MARK, "osrf gateway: parsing URL params");
 	osrfStringArray* mparams = NULL;
 	osrfStringArray* params  = apacheParseParms(r); /* free me */
-	param_locale             = apacheGetFirstParamValue( params, "locale" );
-	service                  = apacheGetFirstParamValue( params, "service" );
-	method                   = apacheGetFirstParamValue( params, "method" );
-	format                   = apacheGetFirstParamValue( params, "format" );
-	input_format             = apacheGetFirstParamValue( params, "input_format" );
-	a_l                      = apacheGetFirstParamValue( params, "api_level" );
-	mparams                  = apacheGetParamValues( params, "param" ); /* free me */
+	char* tout = NULL;           /* request timeout in seconds */
+
+	if(params) {
+		/* pull every value of interest in a single pass over the
+		   key/value pairs rather than rescanning the array per key;
+		   first occurrence wins for the single-valued params */
+		int i;
+		mparams = osrfNewStringArray(12); /* free me */
+		for( i = 0; i < params->size; i += 2 ) {
+			const char* pkey = osrfStringArrayGetString(params, i);
+			const char* pval = osrfStringArrayGetString(params, i + 1);
+			if(!pkey || !pval)
+				continue;
+			if(!strcmp(pkey, "param"))
+				osrfStringArrayAdd(mparams, pval);
+			else if(!param_locale && !strcmp(pkey, "locale"))
+				param_locale = strdup(pval);
+			else if(!service && !strcmp(pkey, "service"))
+				service = strdup(pval);
+			else if(!method && !strcmp(pkey, "method"))
+				method = strdup(pval);
+			else if(!format && !strcmp(pkey, "format"))
+				format = strdup(pval);
+			else if(!input_format && !strcmp(pkey, "input_format"))
+				input_format = strdup(pval);
+			else if(!a_l && !strcmp(pkey, "api_level"))
+				a_l = strdup(pval);
+			else if(!tout && !strcmp(pkey, "timeout"))
+				tout = strdup(pval);
+		}
+	}
 
 	if(format == NULL)
 		format = strdup( "json" );
@@ -168,7 +191,6 @@ static int osrf_json_gateway_method_handler (request_rec *r) {
 
 	/* set the user defined timeout value */
 	int timeout = 60;
-	char* tout = apacheGetFirstParamValue( params, "timeout" ); /* request timeout in seconds */
 	if( tout ) {
 		timeout = atoi(tout);
 		osrfLogDebug(OSRF_LOG_MARK, "Client supplied timeout of %d", timeout);
@@ -205,11 +227,11 @@ static int osrf_json_gateway_method_handler (request_rec *r) {
 
 	if (param_locale) {
 		growing_buffer* osrf_locale_buf = buffer_init(16);
-		if (index(param_locale, ',')) {
-			int ind = index(param_locale, ',') - param_locale;
-			int i;
-			for ( i = 0; i < ind && i < 128; i++ )
-				buffer_add_char( osrf_locale_buf, param_locale[i] );
+		const char* comma = strchr(param_locale, ',');
+		if (comma) {
+			size_t ind = comma - param_locale;
+			if (ind > 128) ind = 128;
+			buffer_add_n( osrf_locale_buf, param_locale, ind );
 		} else {
 			buffer_add( osrf_locale_buf, param_locale );
 		}
@@ -289,44 +311,47 @@ static int osrf_json_gateway_method_handler (request_rec *r) {
 
 
 		/* ----------------------------------------------------------------- */
-		/* log all requests to the activity log */
-		const char* authtoken = apr_table_get(r->headers_in, "X-OILS-Authtoken");
-		if(!authtoken) authtoken = "";
-		growing_buffer* act = buffer_init(128);
+		/* log all requests to the activity log, but only assemble the
+		 * message (including every method param) if it will be logged */
+		if( osrfLogActivityWouldLog() ) {
+			const char* authtoken = apr_table_get(r->headers_in, "X-OILS-Authtoken");
+			if(!authtoken) authtoken = "";
+			growing_buffer* act = buffer_init(128);
 #ifdef APACHE_MIN_24
-		buffer_fadd(act, "[%s] [%s] [%s] %s %s", r->connection->client_ip,
-			authtoken, osrf_locale, service, method );
+			buffer_fadd(act, "[%s] [%s] [%s] %s %s", r->connection->client_ip,
+				authtoken, osrf_locale, service, method );
 #else
-		buffer_fadd(act, "[%s] [%s] [%s] %s %s", r->connection->remote_ip,
-			authtoken, osrf_locale, service, method );
+			buffer_fadd(act, "[%s] [%s] [%s] %s %s", r->connection->remote_ip,
+				authtoken, osrf_locale, service, method );
 #endif
 
-		const char* str; int i = 0;
-		int redact_params = 0;
-		while( (str = osrfStringArrayGetString(log_protect_arr, i++)) ) {
-			//osrfLogInternal(OSRF_LOG_MARK, "Checking for log protection [%s]", str);
-			if(!strncmp(method, str, strlen(str))) {
-				redact_params = 1;
-				break;
+			const char* str; int i = 0;
+			int redact_params = 0;
+			while( (str = osrfStringArrayGetString(log_protect_arr, i++)) ) {
+				//osrfLogInternal(OSRF_LOG_MARK, "Checking for log protection [%s]", str);
+				if(!strncmp(method, str, strlen(str))) {
+					redact_params = 1;
+					break;
+				}
 			}
-		}
-		if(redact_params) {
-			OSRF_BUFFER_ADD(act, " **PARAMS REDACTED**");
-		} else {
-			i = 0;
-			while( (str = osrfStringArrayGetString(mparams, i++)) ) {
-				if( i == 1 ) {
-					OSRF_BUFFER_ADD(act, " ");
-					OSRF_BUFFER_ADD(act, str);
-				} else {
-					OSRF_BUFFER_ADD(act, ", ");
-					OSRF_BUFFER_ADD(act, str);
+			if(redact_params) {
+				OSRF_BUFFER_ADD(act, " **PARAMS REDACTED**");
+			} else {
+				i = 0;
+				while( (str = osrfStringArrayGetString(mparams, i++)) ) {
+					if( i == 1 ) {
+						OSRF_BUFFER_ADD(act, " ");
+						OSRF_BUFFER_ADD(act, str);
+					} else {
+						OSRF_BUFFER_ADD(act, ", ");
+						OSRF_BUFFER_ADD(act, str);
+					}
 				}
 			}
-		}
 
-		osrfLogActivity( OSRF_LOG_MARK, "%s", act->buf );
-		buffer_free(act);
+			osrfLogActivity( OSRF_LOG_MARK, "%s", act->buf );
+			buffer_free(act);
+		}
 		/* ----------------------------------------------------------------- */
 
 
@@ -11,6 +11,10 @@ function JSON2js(text) {
 
 JSON2js.fallbackObjectifier = null;
 
+/* class-name -> constructor cache so decodeJS resolves each wrapper
+ * class with eval once, not once per wrapped object in the payload */
+var _decodeJSCtorCache = {};
+
 /* iterates over object, arrays, or fieldmapper objects */
 function jsIterate( arg, callback ) {
     if( arg && typeof arg == 'object' ) {
@@ -40,7 +44,11 @@ function decodeJS(arg) {
             arg[JSON_CLASS_KEY] ) {
 
         try {
-            arg = eval('new ' + arg[JSON_CLASS_KEY] + '(arg[JSON_DATA_KEY])');    
+            var ctor = _decodeJSCtorCache[arg[JSON_CLASS_KEY]] || (
+                _decodeJSCtorCache[arg[JSON_CLASS_KEY]] =
+                    eval('(' + arg[JSON_CLASS_KEY] + ')')
+            );
+            arg = new ctor(arg[JSON_DATA_KEY]);
         } catch(E) {
             if (JSON2js.fallbackObjectifier)
                 arg = JSON2js.fallbackObjectifier(arg, JSON_CLASS_KEY, JSON_DATA_KEY );
@@ -82,8 +90,12 @@ function jsClone(obj) {
             newobj[i] = jsClone(obj[i]);
 
     } else if( obj._isfieldmapper && obj.a ) {
-        eval('newobj = new '+obj.classname + '();');
-        for( var i = 0; i < obj.a.length; i++ ) 
+        var ctor = _decodeJSCtorCache[obj.classname] || (
+            _decodeJSCtorCache[obj.classname] =
+                eval('(' + obj.classname + ')')
+        );
+        newobj = new ctor();
+        for( var i = 0; i < obj.a.length; i++ )
             newobj.a[i] = jsClone(obj.a[i]);
     }
 
@@ -23,19 +23,31 @@ var OSRF_HTTP_HEADER_MULTIPART = 'X-OpenSRF-multipart';
 var OSRF_HTTP_TRANSLATOR = '/osrf-http-translator'; /* XXX config */
 var OSRF_POST_CONTENT_TYPE = 'application/x-www-form-urlencoded';
 
-
-OpenSRF.XHRequest = function(osrf_msg, args) {
-    this.message = osrf_msg;
-    this.args = args;
+/* detect the XHR implementation once at load time rather than
+ * re-running the try/catch constructor probe on every request */
+var OSRF_XHR_IMPL = (function() {
     try {
-        this.xreq =  new XMLHttpRequest();
+        new XMLHttpRequest();
+        return function() { return new XMLHttpRequest(); };
     } catch(e) {
-        try { 
-            this.xreq = new ActiveXObject("Msxml2.XMLHTTP"); 
+        try {
+            new ActiveXObject("Msxml2.XMLHTTP");
+            return function() { return new ActiveXObject("Msxml2.XMLHTTP"); };
         } catch (e2) {
-            this.xreq = new ActiveXObject("Microsoft.XMLHTTP"); 
+            return function() { return new ActiveXObject("Microsoft.XMLHTTP"); };
         }
     }
+})();
+
+/* the user agent cannot change between requests; test it once instead
+ * of running the regex match inside every send() */
+var OSRF_XHR_STAFF_CLIENT =
+    navigator.userAgent.match(/open_ils_staff_client/) != null;
+
+OpenSRF.XHRequest = function(osrf_msg, args) {
+    this.message = osrf_msg;
+    this.args = args;
+    this.xreq = OSRF_XHR_IMPL();
 };
 
 OpenSRF.XHRequest.prototype.send = function() {
@@ -52,7 +64,7 @@ OpenSRF.XHRequest.prototype.send = function() {
          * multi-part messages are deprecated.  Eventually this will go away.
          * For now, continue allowing the Evergreen staff client to use
          * multi-part messages. */
-        if (!navigator.userAgent.match(/open_ils_staff_client/)) {
+        if (!OSRF_XHR_STAFF_CLIENT) {
             /* standard asynchronous call */
             xreq.onreadystatechange = function() {
                 if(xreq.readyState == 4)
@@ -38,6 +38,9 @@ static int _osrfLogIsClient         = 0;
 static char* _osrfLogXid            = NULL; /* current xid */
 /** A prefix used to generate transaction ids.  It incorporates a timestamp and a process id. */
 static char* _osrfLogXidPfx         = NULL; /* xid prefix string */
+/** Length of the xid prefix, so osrfLogMkXid() can append the sequence number in place
+	instead of re-formatting the prefix on every call. */
+static size_t _osrfLogXidPfxLen     = 0;
 
 static void osrfLogSetType( int logtype );
 static void _osrfLogDetail( int level, const char* filename, int line, char* msg );
@@ -156,8 +159,13 @@ void osrfLogForceXid(const char* xid) {
 void osrfLogMkXid( void ) {
    if(_osrfLogIsClient) {
       static int _osrfLogXidInc = 0; /* increments with each new xid for uniqueness */
-      char buf[32];
-      snprintf(buf, sizeof(buf), "%s%d", _osrfLogXidPfx, _osrfLogXidInc);
+      /* the prefix is fixed for the life of the process, so keep it in
+         place and only format the sequence number on each call */
+      static char buf[64] = "";
+      if( !buf[0] && _osrfLogXidPfx )
+         memcpy(buf, _osrfLogXidPfx, _osrfLogXidPfxLen);
+      snprintf(buf + _osrfLogXidPfxLen, sizeof(buf) - _osrfLogXidPfxLen,
+         "%d", _osrfLogXidInc);
       _osrfLogSetXid(buf);
       _osrfLogXidInc++;
    }
@@ -186,6 +194,7 @@ void osrfLogSetIsClient(int is) {
    static char buff[32];
    snprintf(buff, sizeof(buff), "%d%ld", (int)time(NULL), (long) getpid());
    _osrfLogXidPfx = buff;
+   _osrfLogXidPfxLen = strlen(buff);
 }
 
 /**
@@ -274,6 +283,20 @@ void osrfLogSetActivityEnabled( int enabled ) {
 	_osrfLogActivityEnabled = enabled;
 }
 
+/**
+	@brief Report whether a call to osrfLogActivity() would log anything.
+	@return Boolean: true if an activity message would be issued on either
+	the activity or the informational path.
+
+	Callers that assemble expensive activity strings (e.g. a formatted
+	dump of every method parameter) can consult this first and skip the
+	assembly entirely when the message would be discarded.
+*/
+int osrfLogActivityWouldLog( void ) {
+	return ( _osrfLogLevel >= OSRF_LOG_INFO
+		|| ( _osrfLogActivityEnabled && _osrfLogLevel >= OSRF_LOG_ACTIVITY ) );
+}
+
 /**
 	@brief Store an application name for future use.
 	@param appname Pointer to the application name to be stored.
@@ -33,6 +33,11 @@ int osrfCacheInit( const char* serverStrings[], int size, time_t maxCacheSeconds
 	_osrfCache = memcached_create(NULL);
 	_osrfCacheMaxSeconds = maxCacheSeconds;
 
+	/* speak the binary protocol and skip Nagle delays; both cut
+	   per-operation latency for the small get/set traffic we generate */
+	memcached_behavior_set(_osrfCache, MEMCACHED_BEHAVIOR_BINARY_PROTOCOL, 1);
+	memcached_behavior_set(_osrfCache, MEMCACHED_BEHAVIOR_TCP_NODELAY, 1);
+
 	for( i = 0; i < size && serverStrings[i]; i++ ) {
 		/* TODO: modify caller to pass a list of servers all at once */
 		server_pool = memcached_servers_parse(serverStrings[i]);
@@ -50,7 +55,7 @@ int osrfCacheInit( const char* serverStrings[], int size, time_t maxCacheSeconds
 int osrfCachePutObject( const char* key, const jsonObject* obj, time_t seconds ) {
 	if( !(key && obj) ) return -1;
 	char* s = jsonObjectToJSON( obj );
-	osrfLogInternal( OSRF_LOG_MARK, "osrfCachePut(): Putting object (key=%s): %s", key, s);
+	/* osrfCachePutString() logs the key and value; don't log them twice */
 	osrfCachePutString(key, s, seconds);
 	free(s);
 	return 0;
@@ -99,7 +104,7 @@ jsonObject* osrfCacheGetObject( const char* key, ... ) {
 	jsonObject* obj = NULL;
 	if( key ) {
 		char* clean_key = _clean_key( key );
-		const char* data = (const char*) memcached_get(_osrfCache, clean_key, strlen(clean_key), &val_len, &flags, &rc);
+		char* data = (char*) memcached_get(_osrfCache, clean_key, strlen(clean_key), &val_len, &flags, &rc);
 		free(clean_key);
 		if (rc != MEMCACHED_SUCCESS) {
 			osrfLogDebug(OSRF_LOG_MARK, "Failed to get key [%s] - %s",
@@ -108,6 +113,7 @@ jsonObject* osrfCacheGetObject( const char* key, ... ) {
 		if( data ) {
 			osrfLogInternal( OSRF_LOG_MARK, "osrfCacheGetObject(): Returning object (key=%s): %s", key, data);
 			obj = jsonParse( data );
+			free(data); /* memcached_get() returns a malloc'd buffer */
 			return obj;
 		}
 		osrfLogDebug(OSRF_LOG_MARK, "No cache data exists with key %s", key);
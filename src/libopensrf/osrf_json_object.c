@@ -608,6 +608,136 @@ char* jsonObjectToJSON( const jsonObject* obj ) {
 	return buffer_release( buf );
 }
 
+/**
+	@brief Append two spaces per level of indentation.
+	@param buf Pointer to the growing_buffer receiving the output.
+	@param depth Degree of indentation.
+*/
+static void add_pretty_indent( growing_buffer* buf, int depth ) {
+	static const char pad[] = "                                ";  // 32 blanks
+	size_t n = 2 * depth;
+	while( n > sizeof( pad ) - 1 ) {
+		buffer_add_n( buf, pad, sizeof( pad ) - 1 );
+		n -= sizeof( pad ) - 1;
+	}
+	if( n > 0 )
+		buffer_add_n( buf, pad, n );
+}
+
+/**
+	@brief Append an indented JSON representation of a jsonObject to a growing_buffer.
+	@param obj Pointer to the jsonObject whose JSON representation is to be appended.
+	@param buf Pointer to the growing_buffer to which we will append.
+	@param second_pass Boolean; should always be false except for some recursive calls.
+	@param depth Current degree of indentation.
+
+	Like add_json_to_buffer() with class name expansion, but emits newlines and
+	indentation as it walks the object, so no second pass over the serialized
+	string is needed to prettyprint it.
+*/
+static void add_json_to_buffer_pretty( const jsonObject* obj,
+	growing_buffer* buf, int second_pass, int depth ) {
+
+	if(NULL == obj) {
+		OSRF_BUFFER_ADD(buf, "null");
+		return;
+	}
+
+	if( obj->classname && !second_pass ) {
+		// Pretend we see an extra layer of JSON_HASH
+		OSRF_BUFFER_ADD( buf, "{\n" );
+		add_pretty_indent( buf, depth + 1 );
+		OSRF_BUFFER_ADD_CHAR( buf, '"' );
+		OSRF_BUFFER_ADD( buf, JSON_CLASS_KEY );
+		OSRF_BUFFER_ADD( buf, "\":\"" );
+		OSRF_BUFFER_ADD( buf, obj->classname );
+		OSRF_BUFFER_ADD( buf, "\",\n" );
+		add_pretty_indent( buf, depth + 1 );
+		OSRF_BUFFER_ADD_CHAR( buf, '"' );
+		OSRF_BUFFER_ADD( buf, JSON_DATA_KEY );
+		OSRF_BUFFER_ADD( buf, "\":" );
+		add_json_to_buffer_pretty( obj, buf, 1, depth + 1 );
+		OSRF_BUFFER_ADD_CHAR( buf, '\n' );
+		add_pretty_indent( buf, depth );
+		buffer_add_char( buf, '}' );
+		return;
+	}
+
+	switch(obj->type) {
+
+		case JSON_BOOL :
+		case JSON_NUMBER:
+		case JSON_NULL:
+		case JSON_STRING:
+			add_json_to_buffer( obj, buf, 1, second_pass );
+			break;
+
+		case JSON_ARRAY: {
+			if( !obj->value.l || obj->value.l->size < 1 ) {
+				OSRF_BUFFER_ADD(buf, "[]");
+				break;
+			}
+			OSRF_BUFFER_ADD(buf, "[\n");
+			int i;
+			for( i = 0; i != obj->value.l->size; i++ ) {
+				if(i > 0) OSRF_BUFFER_ADD(buf, ",\n");
+				add_pretty_indent( buf, depth + 1 );
+				add_json_to_buffer_pretty(
+					OSRF_LIST_GET_INDEX(obj->value.l, i), buf, 0, depth + 1 );
+			}
+			OSRF_BUFFER_ADD_CHAR(buf, '\n');
+			add_pretty_indent( buf, depth );
+			OSRF_BUFFER_ADD_CHAR(buf, ']');
+			break;
+		}
+
+		case JSON_HASH: {
+			osrfHashIterator* itr = osrfNewHashIterator(obj->value.h);
+			jsonObject* item;
+			int i = 0;
+
+			while( (item = osrfHashIteratorNext(itr)) ) {
+				if(i++ > 0)
+					OSRF_BUFFER_ADD(buf, ",\n");
+				else
+					OSRF_BUFFER_ADD(buf, "{\n");
+				add_pretty_indent( buf, depth + 1 );
+				OSRF_BUFFER_ADD_CHAR(buf, '"');
+				buffer_append_utf8(buf, osrfHashIteratorKey(itr));
+				OSRF_BUFFER_ADD(buf, "\":");
+				add_json_to_buffer_pretty( item, buf, 0, depth + 1 );
+			}
+
+			osrfHashIteratorFree(itr);
+			if( i > 0 ) {
+				OSRF_BUFFER_ADD_CHAR(buf, '\n');
+				add_pretty_indent( buf, depth );
+				OSRF_BUFFER_ADD_CHAR(buf, '}');
+			} else
+				OSRF_BUFFER_ADD(buf, "{}");
+			break;
+		}
+	}
+}
+
+/**
+	@brief Translate a jsonObject into an indented JSON string, with class name expansion.
+	@param obj Pointer to the jsonObject to be translated.
+	@return A pointer to a newly allocated string containing the formatted JSON.
+
+	Produces output equivalent to running jsonObjectToJSON() through
+	jsonFormatString(), but in a single pass over the object, without
+	serializing and then rescanning the intermediate string.
+
+	The calling code is responsible for freeing the resulting string.
+*/
+char* jsonObjectToJSONPretty( const jsonObject* obj ) {
+	if(!obj) return NULL;
+	growing_buffer* buf = buffer_init(128);
+	add_json_to_buffer_pretty( obj, buf, 0, 0 );
+	return buffer_release( buf );
+}
+
 /**
 	@brief Create a new jsonIterator for traversing a specified jsonObject.
 	@param obj Pointer to the jsonObject to be traversed.
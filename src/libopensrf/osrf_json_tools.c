@@ -26,13 +26,18 @@ static jsonObject* _jsonObjectEncodeClass( const jsonObject* obj, int ignoreClas
 	@param buf Pointer to the growing_buffer.
 	@param depth Degree of indentation.
 
-	We append 2 spaces per degree of indentation.
+	We append 2 spaces per degree of indentation, drawn from a constant
+	pad of blanks instead of building a fresh one on each call.
 */
 static void append_indentation( growing_buffer* buf, int depth ) {
+	static const char indent[] = "                                ";  // 32 blanks
 	size_t n = 2 * depth;
-	char indent[ n ];
-	memset( indent, ' ', n );
-	buffer_add_n( buf, indent, n );
+	while( n > sizeof( indent ) - 1 ) {
+		buffer_add_n( buf, indent, sizeof( indent ) - 1 );
+		n -= sizeof( indent ) - 1;
+	}
+	if( n > 0 )
+		buffer_add_n( buf, indent, n );
 }
 
 /**
@@ -53,7 +58,9 @@ static void append_indentation( growing_buffer* buf, int depth ) {
 char* jsonFormatString( const char* string ) {
 	if( !string ) return strdup( "" );
 
-	growing_buffer* buf = buffer_init( 64 );
+	// the output is the input plus whitespace; start the buffer at the
+	// input length so typical documents format without reallocation
+	growing_buffer* buf = buffer_init( strlen( string ) + 64 );
 	int i;
 	int depth = 0;
 	int in_quote = 0;   // boolean; true if in a string literal
@@ -64,6 +71,20 @@ char* jsonFormatString( const char* string ) {
 	for( i = 0; string[i]; i++ ) {
 		c = string[ i ];
 
+		// Inside a string literal nothing affects depth or line breaks
+		// until the closing quote or an escape, so copy such runs in
+		// bulk instead of dispatching through the state machine per
+		// character.
+		if( in_quote && !escaped && '\"' != c && '\\' != c ) {
+			const char* start = string + i;
+			const char* p = start;
+			while( *p && '\"' != *p && '\\' != *p )
+				++p;
+			buffer_add_n( buf, start, p - start );
+			i += ( p - start ) - 1;   // for() adds the final increment
+			continue;
+		}
+
 		if( c == '{' || c == '[' ) {
 
 			OSRF_BUFFER_ADD_CHAR( buf, c );
@@ -5,6 +5,7 @@
 struct osrfXMLGatewayParserStruct {
     osrfList* objStack;
     osrfList* keyStack;
+    growing_buffer* cdata;
     jsonObject* obj;
     short inString;
     short inNumber;
@@ -54,84 +55,103 @@ static void startElementHandler(
     osrfXMLGatewayParser* p = (osrfXMLGatewayParser*) parser;
     jsonObject* obj;
 
-    char* hint = getXMLAttr(atts, "class_hint");
+    /* dispatch on the first character of the tag name; each branch
+       runs at most one full strcmp instead of walking the whole
+       tag list for every element */
+    switch(name[0]) {
 
-    if(!strcmp((char*) name, "null")) {
-        appendChild(p, jsonNewObject(NULL));
-        return;
-    }
-
-    if(!strcmp((char*) name, "string")) {
-        p->inString = 1;
-        return;
-    }
-
-    if(!strcmp((char*) name, "element")) {
-       osrfListPush(p->keyStack, strdup(getXMLAttr(atts, "key")));
-       return;
-    }
+        case 'n':
+            if(!strcmp((char*) name, "null")) {
+                appendChild(p, jsonNewObject(NULL));
+            } else if(!strcmp((char*) name, "number")) {
+                p->inNumber = 1;
+            }
+            return;
+
+        case 's':
+            if(!strcmp((char*) name, "string"))
+                p->inString = 1;
+            return;
+
+        case 'e':
+            if(!strcmp((char*) name, "element"))
+                osrfListPush(p->keyStack, strdup(getXMLAttr(atts, "key")));
+            return;
+
+        case 'o':
+            if(!strcmp((char*) name, "object")) {
+                obj = jsonNewObject(NULL);
+                /* only objects and arrays carry class hints; look for the
+                   attribute just for them instead of scanning the attribute
+                   list of every element.  OK if the hint is NULL */
+                jsonObjectSetClass(obj, getXMLAttr(atts, "class_hint"));
+                obj->type = JSON_HASH;
+                appendChild(p, obj);
+                osrfListPush(p->objStack, obj);
+            }
+            return;
+
+        case 'a':
+            if(!strcmp((char*) name, "array")) {
+                obj = jsonNewObject(NULL);
+                jsonObjectSetClass(obj, getXMLAttr(atts, "class_hint"));
+                obj->type = JSON_ARRAY;
+                appendChild(p, obj);
+                osrfListPush(p->objStack, obj);
+            }
+            return;
 
-    if(!strcmp((char*) name, "object")) {
-        obj = jsonNewObject(NULL);
-        jsonObjectSetClass(obj, hint); /* OK if hint is NULL */
-        obj->type = JSON_HASH;
-        appendChild(p, obj);
-        osrfListPush(p->objStack, obj);
-        return;
-    }
+        case 'b':
+            if(!strcmp((char*) name, "boolean")) {
+                obj = jsonNewObject(NULL);
+                obj->type = JSON_BOOL;
+                char* val = getXMLAttr(atts, "value");
+                if(val && !strcmp(val, "true"))
+                    obj->value.b = 1;
 
-    if(!strcmp((char*) name, "array")) {
-        obj = jsonNewObject(NULL);
-        jsonObjectSetClass(obj, hint); /* OK if hint is NULL */
-        obj->type = JSON_ARRAY;
-        appendChild(p, obj);
-        osrfListPush(p->objStack, obj);
-        return;
+                appendChild(p, obj);
+            }
+            return;
     }
+}
 
+static void endElementHandler( void *parser, const xmlChar *name) {
+    /* only container tags matter here; check the first character before
+       paying for a strcmp on every close tag */
+    osrfXMLGatewayParser* p = (osrfXMLGatewayParser*) parser;
 
-    if(!strcmp((char*) name, "number")) {
-        p->inNumber = 1;
+    if(name[0] == 's' && !strcmp((char*) name, "string")) {
+        if(p->inString) {
+            appendChild(p, jsonNewObject(p->cdata->buf));
+            buffer_reset(p->cdata);
+            p->inString = 0;
+        }
         return;
     }
 
-    if(!strcmp((char*) name, "boolean")) {
-        obj = jsonNewObject(NULL);
-        obj->type = JSON_BOOL;
-        char* val = getXMLAttr(atts, "value");
-        if(val && !strcmp(val, "true"))
-            obj->value.b = 1;
-        
-        appendChild(p, obj);
+    if(name[0] == 'n' && !strcmp((char*) name, "number")) {
+        if(p->inNumber) {
+            appendChild(p, jsonNewNumberObject(atof(p->cdata->buf)));
+            buffer_reset(p->cdata);
+            p->inNumber = 0;
+        }
         return;
     }
-}
 
-static void endElementHandler( void *parser, const xmlChar *name) {
-    if(!strcmp((char*) name, "array") || !strcmp((char*) name, "object")) {
-        osrfXMLGatewayParser* p = (osrfXMLGatewayParser*) parser;
+    if((name[0] == 'a' && !strcmp((char*) name, "array"))
+        || (name[0] == 'o' && !strcmp((char*) name, "object"))) {
         osrfListPop(p->objStack);
     }
 }
 
 static void characterHandler(void *parser, const xmlChar *ch, int len) {
 
-    char data[len+1];
-    strncpy(data, (char*) ch, len);
-    data[len] = '\0';
     osrfXMLGatewayParser* p = (osrfXMLGatewayParser*) parser;
 
-    if(p->inString) {
-        appendChild(p, jsonNewObject(data));
-        p->inString = 0;
-        return;
-    }
-
-    if(p->inNumber) {
-        appendChild(p, jsonNewNumberObject(atof(data)));
-        p->inNumber = 0;
-        return;
-    }
+    /* libxml2 may hand us one logical text node in several callbacks;
+       accumulate the pieces and build the value at the closing tag */
+    if(p->inString || p->inNumber)
+        buffer_add_n(p->cdata, (const char*) ch, len);
 }
 
 static void parseWarningHandler(void *parser, const char* msg, ...) {
@@ -207,6 +227,7 @@ jsonObject* jsonXMLToJSONObject(const char* xml) {
     parser.objStack = osrfNewList(); 
     /* don't define freeItem, since the list eill end up empty if there are no errors*/
     parser.keyStack = osrfNewList(); 
+    parser.cdata = buffer_init(64);
     parser.obj = NULL;
     parser.inString = 0;
     parser.inNumber = 0;
@@ -216,10 +237,14 @@ jsonObject* jsonXMLToJSONObject(const char* xml) {
 
     osrfListFree(parser.objStack);
     osrfListFree(parser.keyStack);
+    buffer_free(parser.cdata);
     xmlFreeParserCtxt(ctxt);
-    xmlCleanupCharEncodingHandlers();
-    xmlDictCleanup();
-    xmlCleanupParser();
+
+    /* Note: the library-wide teardown routines (xmlCleanupParser() and
+       friends) are intentionally not called here.  They are meant for
+       process exit only; invoking them after every parse forced libxml2
+       to rebuild its global encoding and dictionary state on the next
+       request, and they are unsafe if any other thread is parsing. */
 
     return parser.obj;
 }
@@ -229,7 +254,7 @@ jsonObject* jsonXMLToJSONObject(const char* xml) {
 
 
 
-static char* _escape_xml (const char*);
+static void _append_escaped_xml (growing_buffer*, const char*);
 static int _recurse_jsonObjectToXML(const jsonObject*, growing_buffer*);
 
 char* jsonObjectToXML(const jsonObject* obj) {
@@ -246,10 +271,8 @@ char* jsonObjectToXML(const jsonObject* obj) {
 
 int _recurse_jsonObjectToXML(const jsonObject* obj, growing_buffer* res_xml) {
 
-	char * hint = NULL;
-	
-	if (obj->classname)
-		hint = strdup(obj->classname);
+	/* the class hint is used read-only; no need to copy it per node */
+	const char* hint = obj->classname;
 
 	if(obj->type == JSON_NULL) {
 
@@ -268,19 +291,18 @@ int _recurse_jsonObjectToXML(const jsonObject* obj, growing_buffer* res_xml) {
 
 		if (hint)
 			buffer_fadd(res_xml, "<boolean value=\"%s\" class_hint=\"%s\"/>", bool_val, hint);
+		else if (obj->value.b)
+			buffer_add(res_xml, "<boolean value=\"true\"/>");
 		else
-			buffer_fadd(res_xml, "<boolean value=\"%s\"/>", bool_val);
+			buffer_add(res_xml, "<boolean value=\"false\"/>");
 
 	} else if (obj->type == JSON_STRING) {
-		if (hint) {
-			char * t = _escape_xml(jsonObjectGetString(obj));
-			buffer_fadd(res_xml,"<string class_hint=\"%s\">%s</string>", hint, t);
-			free(t);
-		} else {
-			char * t = _escape_xml(jsonObjectGetString(obj));
-			buffer_fadd(res_xml,"<string>%s</string>", t);
-			free(t);
-		}
+		if (hint)
+			buffer_fadd(res_xml,"<string class_hint=\"%s\">", hint);
+		else
+			buffer_add(res_xml,"<string>");
+		_append_escaped_xml(res_xml, jsonObjectGetString(obj));
+		buffer_add(res_xml,"</string>");
 
 	} else if(obj->type == JSON_NUMBER) {
 		double x = jsonObjectGetNumber(obj);
@@ -328,27 +350,32 @@ int _recurse_jsonObjectToXML(const jsonObject* obj, growing_buffer* res_xml) {
 		buffer_add(res_xml,"</object>");
 	}
 
-	if (hint)
-		free(hint);
-
 	return 1;
 }
 
-static char* _escape_xml (const char* text) {
-	growing_buffer* b = buffer_init(256);
-	int len = strlen(text);
-	int i;
-	for (i = 0; i < len; i++) {
-		if (text[i] == '&')
-			buffer_add(b,"&amp;");
-		else if (text[i] == '<')
-			buffer_add(b,"&lt;");
-		else if (text[i] == '>')
-			buffer_add(b,"&gt;");
-		else
-			buffer_add_char(b,text[i]);
+/* Escape straight into the output buffer, rather than building an
+   escaped copy only to have the caller append and free it */
+static void _append_escaped_xml (growing_buffer* b, const char* text) {
+	const char* start = text;
+	const char* p = text;
+
+	/* copy runs of ordinary characters in one shot and only stop
+	   at the characters that actually need escaping */
+	for ( ; *p; p++ ) {
+		const char* entity;
+		switch (*p) {
+			case '&': entity = "&amp;"; break;
+			case '<': entity = "&lt;";  break;
+			case '>': entity = "&gt;";  break;
+			default:  continue;
+		}
+		if (p > start)
+			buffer_add_n(b, start, p - start);
+		buffer_add(b, entity);
+		start = p + 1;
 	}
-	return buffer_release(b);
+	if (p > start)
+		buffer_add_n(b, start, p - start);
 }
 
 #endif
@@ -227,6 +227,18 @@ static const char* get_string( Parser* parser ) {
 
 	// Collect the characters.
 	for( ;; ) {
+
+		// Most strings contain no escapes; copy unremarkable runs in
+		// bulk instead of appending one character at a time.
+		const char* start = parser->buff + parser->index;
+		const char* p = start;
+		while( *p && '"' != *p && '\\' != *p )
+			++p;
+		if( p > start ) {
+			buffer_add_n( gb, start, p - start );
+			parser->index += p - start;
+		}
+
 		char c = parser_nextc( parser );
 		if( '"' == c )
 			break;
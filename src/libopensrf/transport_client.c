@@ -231,7 +231,10 @@ transport_message* client_recv( transport_client* client, int timeout ) {
 			/* This loop assumes that a time_t is denominated in seconds -- not */
 			/* guaranteed by Standard C, but a fair bet for Linux or UNIX       */
 
-			time_t start = time(NULL);
+			/* Compute the deadline once; measuring each pass against it avoids
+			   double-counting elapsed time across iterations, which used to
+			   shorten the effective timeout whenever we looped. */
+			time_t deadline = time(NULL) + (time_t) timeout;
 			time_t remaining = (time_t) timeout;
 
 			int wait_ret;
@@ -243,7 +246,7 @@ transport_message* client_recv( transport_client* client, int timeout ) {
 					break;
 				}
 
-				remaining -= time(NULL) - start;
+				remaining = deadline - time(NULL);
 			} while( NULL == client->msg_q_head && remaining > 0 );
 		}
 	}
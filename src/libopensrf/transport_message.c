@@ -313,6 +313,73 @@ int message_free( transport_message* msg ){
 }
 
 
+/**
+	@brief Append an XML attribute, with escaping, to a growing_buffer.
+	@param buf Pointer to the growing_buffer.
+	@param name Name of the attribute.
+	@param value Value of the attribute; a NULL is treated as an empty string.
+
+	UTF-8 passes through untouched; only the markup characters (and the
+	whitespace characters that XML parsers may normalize inside attribute
+	values) become character entity references.
+*/
+static void append_xml_attr( growing_buffer* buf, const char* name, const char* value ) {
+	OSRF_BUFFER_ADD_CHAR( buf, ' ' );
+	buffer_add( buf, name );
+	buffer_add( buf, "=\"" );
+	if( value ) {
+		const char* start = value;
+		const char* p = value;
+		for( ; *p; p++ ) {
+			const char* entity;
+			switch( *p ) {
+				case '&':  entity = "&amp;";  break;
+				case '<':  entity = "&lt;";   break;
+				case '>':  entity = "&gt;";   break;
+				case '"':  entity = "&quot;"; break;
+				case '\n': entity = "&#10;";  break;
+				case '\r': entity = "&#13;";  break;
+				case '\t': entity = "&#9;";   break;
+				default:   continue;
+			}
+			if( p > start )
+				buffer_add_n( buf, start, p - start );
+			buffer_add( buf, entity );
+			start = p + 1;
+		}
+		if( p > start )
+			buffer_add_n( buf, start, p - start );
+	}
+	OSRF_BUFFER_ADD_CHAR( buf, '"' );
+}
+
+/**
+	@brief Append XML text content, with escaping, to a growing_buffer.
+	@param buf Pointer to the growing_buffer.
+	@param text The text to append; a NULL is treated as an empty string.
+*/
+static void append_xml_text( growing_buffer* buf, const char* text ) {
+	if( !text ) return;
+	const char* start = text;
+	const char* p = text;
+	for( ; *p; p++ ) {
+		const char* entity;
+		switch( *p ) {
+			case '&':  entity = "&amp;"; break;
+			case '<':  entity = "&lt;";  break;
+			case '>':  entity = "&gt;";  break;
+			case '\r': entity = "&#13;"; break;
+			default:   continue;
+		}
+		if( p > start )
+			buffer_add_n( buf, start, p - start );
+		buffer_add( buf, entity );
+		start = p + 1;
+	}
+	if( p > start )
+		buffer_add_n( buf, start, p - start );
+}
+
 /**
 	@brief Build a &lt;message&gt; element and store it as a string in the msg_xml member.
 	@param msg Pointer to a transport_message.
@@ -323,92 +390,64 @@ int message_free( transport_message* msg ){
 	The contents of the &lt;message&gt; element come from various members of the
 	transport_message.  Store the resulting string as the msg_xml member.
 
-	To build the XML we first build a DOM structure, and then export it to a string.  That
-	way we can let the XML library worry about replacing certain characters with
-	character entity references -- not a trivial task when UTF-8 characters may be present.
+	The stanza layout is fixed, so we build the string directly instead of
+	constructing a DOM and dumping it, which allocated a document, half a
+	dozen nodes and an export buffer for every outbound message.  The only
+	part that needs care is entity escaping, handled by append_xml_attr()
+	and append_xml_text() above.
 */
 int message_prepare_xml( transport_message* msg ) {
 
 	if( !msg ) return 0;
 	if( msg->msg_xml ) return 1;   /* already done */
 
-	xmlNodePtr  message_node;
-	xmlNodePtr  body_node;
-	xmlNodePtr  thread_node;
-	xmlNodePtr  opensrf_node;
-	xmlNodePtr  subject_node;
-	xmlNodePtr  error_node;
-
-	xmlDocPtr   doc;
-
-	xmlKeepBlanksDefault(0);
+	growing_buffer* buf = buffer_init( 512 + ( msg->body ? strlen( msg->body ) : 0 ));
 
-	doc = xmlReadDoc( BAD_CAST "<message/>", NULL, NULL, XML_PARSE_NSCLEAN );
-	message_node = xmlDocGetRootElement(doc);
+	buffer_add( buf, "<message" );
+	append_xml_attr( buf, "to", msg->recipient );
+	append_xml_attr( buf, "from", msg->sender );
+	OSRF_BUFFER_ADD_CHAR( buf, '>' );
 
 	if( msg->is_error ) {
-		error_node = xmlNewChild(message_node, NULL, BAD_CAST "error" , NULL );
-		xmlAddChild( message_node, error_node );
-		xmlNewProp( error_node, BAD_CAST "type", BAD_CAST msg->error_type );
+		buffer_add( buf, "<error" );
+		append_xml_attr( buf, "type", msg->error_type );
 		char code_buf[16];
-		osrf_clearbuf( code_buf, sizeof(code_buf));
-		sprintf(code_buf, "%d", msg->error_code );
-		xmlNewProp( error_node, BAD_CAST "code", BAD_CAST code_buf  );
-	}
-
-	/* set from and to */
-	xmlNewProp( message_node, BAD_CAST "to", BAD_CAST msg->recipient );
-	xmlNewProp( message_node, BAD_CAST "from", BAD_CAST msg->sender );
-
-	/* set from and to on a new node, also */
-	opensrf_node = xmlNewChild(message_node, NULL, (xmlChar*) "opensrf", NULL );
-	xmlNewProp( opensrf_node, BAD_CAST "router_from", BAD_CAST msg->router_from );
-	xmlNewProp( opensrf_node, BAD_CAST "router_to", BAD_CAST msg->router_to );
-	xmlNewProp( opensrf_node, BAD_CAST "router_class", BAD_CAST msg->router_class );
-	xmlNewProp( opensrf_node, BAD_CAST "router_command", BAD_CAST msg->router_command );
-	xmlNewProp( opensrf_node, BAD_CAST "osrf_xid", BAD_CAST msg->osrf_xid );
-
-	xmlAddChild(message_node, opensrf_node);
-
-	if( msg->broadcast ) {
-		xmlNewProp( opensrf_node, BAD_CAST "broadcast", BAD_CAST "1" );
+		snprintf( code_buf, sizeof(code_buf), "%d", msg->error_code );
+		append_xml_attr( buf, "code", code_buf );
+		buffer_add( buf, "/>" );
 	}
 
-	/* Now add nodes where appropriate */
-	char* body      = msg->body;
-	char* subject   = msg->subject;
-	char* thread    = msg->thread;
-
-	if( thread && *thread ) {
-		thread_node = xmlNewChild(message_node, NULL, (xmlChar*) "thread", NULL );
-		xmlNodePtr txt = xmlNewText((xmlChar*) thread);
-		xmlAddChild(thread_node, txt);
-		xmlAddChild(message_node, thread_node);
+	buffer_add( buf, "<opensrf" );
+	append_xml_attr( buf, "router_from", msg->router_from );
+	append_xml_attr( buf, "router_to", msg->router_to );
+	append_xml_attr( buf, "router_class", msg->router_class );
+	append_xml_attr( buf, "router_command", msg->router_command );
+	append_xml_attr( buf, "osrf_xid", msg->osrf_xid );
+	if( msg->broadcast )
+		append_xml_attr( buf, "broadcast", "1" );
+	buffer_add( buf, "/>" );
+
+	if( msg->thread && *msg->thread ) {
+		buffer_add( buf, "<thread>" );
+		append_xml_text( buf, msg->thread );
+		buffer_add( buf, "</thread>" );
 	}
 
-	if( subject && *subject ) {
-		subject_node = xmlNewChild(message_node, NULL, (xmlChar*) "subject", NULL );
-		xmlNodePtr txt = xmlNewText((xmlChar*) subject);
-		xmlAddChild(subject_node, txt);
-		xmlAddChild( message_node, subject_node );
+	if( msg->subject && *msg->subject ) {
+		buffer_add( buf, "<subject>" );
+		append_xml_text( buf, msg->subject );
+		buffer_add( buf, "</subject>" );
 	}
 
-	if( body && *body ) {
-		body_node = xmlNewChild(message_node, NULL, (xmlChar*) "body", NULL);
-		xmlNodePtr txt = xmlNewText((xmlChar*) body);
-		xmlAddChild(body_node, txt);
-		xmlAddChild( message_node, body_node );
+	if( msg->body && *msg->body ) {
+		buffer_add( buf, "<body>" );
+		append_xml_text( buf, msg->body );
+		buffer_add( buf, "</body>" );
 	}
 
-	// Export the xmlDoc to a string
-	xmlBufferPtr xmlbuf = xmlBufferCreate();
-	xmlNodeDump( xmlbuf, doc, xmlDocGetRootElement(doc), 0, 0);
-	msg->msg_xml = strdup((const char*) (xmlBufferContent(xmlbuf)));
-
-	xmlBufferFree(xmlbuf);
-	xmlFreeDoc( doc );
-	xmlCleanupParser();
+	buffer_add( buf, "</message>" );
 
+	msg->msg_xml = buffer_release( buf );
 	return 1;
 }
 
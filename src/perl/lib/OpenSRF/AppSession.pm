@@ -24,6 +24,7 @@ our %EXPORT_TAGS = ( state => [ qw/CONNECTING INIT_CONNECTED CONNECTED DISCONNEC
 
 my $logger = "OpenSRF::Utils::Logger";
 my $_last_locale = 'en-US';
+my $_sess_id_seq = 0; # per-process session id sequence
 our $current_ingress = 'opensrf';
 
 # Get/set the locale used by all new client sessions 
@@ -260,9 +261,12 @@ sub create {
 		$stateless = $c->config_value("apps", $app, "stateless");
 	}
 
-	my $sess_id = time . rand( $$ );
+	# time + pid + a per-process sequence is unique on its own; no need
+	# to draw random numbers per session.  the find() loop stays as a
+	# belt-and-suspenders check
+	my $sess_id = time . ".$$." . ++$_sess_id_seq;
 	while ( $class->find($sess_id) ) {
-		$sess_id = time . rand( $$ );
+		$sess_id = time . ".$$." . ++$_sess_id_seq;
 	}
 
 	
@@ -579,7 +583,7 @@ sub send {
 
 	} 
 	my $json = OpenSRF::Utils::JSON->perl2JSON(\@doc);
-	$logger->internal("AppSession sending doc: $json");
+	$logger->internal(sub{return "AppSession sending doc: $json" });
 
 	$self->{peer_handle}->send( 
 					to     => $self->remote_id,
@@ -753,10 +757,15 @@ sub recv {
 	#$args{timeout} = 0 if ($self->complete);
 
 	if(defined($args{timeout})) {
-		$logger->debug( ref($self) ."->recv with timeout " . $args{timeout}, INTERNAL );
+		$logger->debug(sub{return ref($self) ."->recv with timeout " . $args{timeout} }, INTERNAL );
 	}
 
-	my $avail = @{ $self->{recv_queue} };
+	# the queue arrayref never changes for the life of the session, so
+	# grab it once instead of re-fetching the hash slot on every pass
+	# through the wait loop below
+	my $recv_queue = $self->{recv_queue};
+
+	my $avail = @$recv_queue;
 	$self->{remaining_recv_timeout} = $self->{recv_timeout};
 
 	if (!$args{count}) {
@@ -777,13 +786,13 @@ sub recv {
 			} else {
 				$self->{remaining_recv_timeout} -= ($endtime - $starttime)
 			}
-			$avail = @{ $self->{recv_queue} };
+			$avail = @$recv_queue;
 	}
 
     $self->timed_out(1) if ( $self->{remaining_recv_timeout} <= 0 );
 
 	my @list;
-	while ( my $msg = shift @{ $self->{recv_queue} } ) {
+	while ( my $msg = shift @$recv_queue ) {
 		push @list, $msg;
 		last if (scalar(@list) >= $args{count});
 	}
@@ -828,11 +837,9 @@ sub queue_wait {
 
 sub _print_queue {
 	my( $self ) = @_;
-	my $string = "";
-	foreach my $msg ( @{$self->{recv_queue}} ) {
-		$string = $string . $msg->toString(1) . "\n";
-	}
-	return $string;
+	# join instead of repeated concatenation; each . above copied the
+	# whole accumulated string again
+	return join( '', map { $_->toString(1) . "\n" } @{$self->{recv_queue}} );
 }
 
 sub status {
@@ -1082,7 +1089,7 @@ sub respond {
             }
 
             if ($raw_length > $chunk_size) { # send partials ("chunking")
-                my $num_bytes = length(Encode::encode_utf8($str));
+                my $num_bytes = $raw_length; # already counted above
                 for (my $i = 0; $i < $num_bytes; $i += $chunk_size) {
                     $response = new OpenSRF::DomainObject::oilsResult::Partial;
                     $response->content( substr($str, $i, $chunk_size) );
@@ -1128,6 +1135,8 @@ sub respond_complete {
 	my $msg = shift;
 	return unless ($self and $self->session and !$self->complete);
 
+    # streaming methods that already respond()ed everything return
+    # undef; skip the payload frame and send only the completion status
     $self->respond($msg) if (defined($msg));
 
     $self->completing(1);
@@ -24,6 +24,10 @@ our $in_request = 0;
 our @pending_requests;
 our $shared_conf;
 
+# sorted api_name lists per api_level, built lazily for introspection
+# and invalidated whenever a method is registered
+my @_method_name_cache;
+
 sub package {
 	my $self = shift;
 	return 1 unless ref($self);
@@ -109,7 +113,9 @@ sub application_implementation {
 	my $self = shift;
 	my $app = shift;
 
-	if (defined $app) {
+	if (defined $app and (!defined $_app or $_app ne $app)) {
+		# only pay the UNIVERSAL::require string-eval when the
+		# implementation class actually changes
 		$_app = $app;
 		$_app->use;
 		if( $@ ) {
@@ -138,25 +144,29 @@ sub handler {
 
 		# By default, we log all method params at the info level
 		# Here we are consult our shared portion of the config file
-		# to look for any exceptions to this behavior
-		my $logdata = "CALL: ".$session->service." $method_name ";
-		my $redact_params = 0;
-		if (@p) {
-			if (ref($shared_conf->shared->log_protect) eq 'ARRAY') {
-				foreach my $match_string (@{$shared_conf->shared->log_protect}) {
-					if ($method_name =~ /^$match_string/) {
-						$redact_params = 1;
-						last;
+		# to look for any exceptions to this behavior.  The delayed-exec
+		# sub form means the param join (and redaction scan) only runs
+		# when INFO logging is actually enabled.
+		$log->info(sub{
+			my $logdata = "CALL: ".$session->service." $method_name ";
+			my $redact_params = 0;
+			if (@p) {
+				if (ref($shared_conf->shared->log_protect) eq 'ARRAY') {
+					foreach my $match_string (@{$shared_conf->shared->log_protect}) {
+						if ($method_name =~ /^$match_string/) {
+							$redact_params = 1;
+							last;
+						}
 					}
 				}
+				if ($redact_params) {
+					$logdata .= "**PARAMS REDACTED**";
+				} else {
+					$logdata .= join(', ', map { (defined $_) ? $_ : '' } @p);
+				}
 			}
-			if ($redact_params) {
-				$logdata .= "**PARAMS REDACTED**";
-			} else {
-				$logdata .= join(', ', map { (defined $_) ? $_ : '' } @p);
-			}
-		}
-		$log->info($logdata);
+			return $logdata;
+		});
 
 		my $coderef = $app->method_lookup( $method_name, $method_proto, 1, 1 );
 
@@ -177,7 +187,9 @@ sub handler {
 		}
 
 		if (ref $coderef) {
-			my @args = $app_msg->params;
+			# params were already pulled off the message above; don't
+			# rebuild the argument list for dispatch
+			my @args = @p;
 			$coderef->session( $session );
 			my $appreq = OpenSRF::AppRequest->new( $session );
 			$appreq->max_bundle_size( $coderef->max_bundle_size );
@@ -268,6 +280,9 @@ sub handler {
 			# cycle through queued requests
 			while( my $aref = shift @pending_requests ) {
 				$in_request++;
+				# unpack once; the run/log/error paths below each used
+				# to re-index the queued triple several times over
+				my ($q_appreq, $q_args, $q_coderef) = @$aref;
 				my $resp;
 				try {
 					# un-if(0) this block to enable param checking based on signature and argc
@@ -301,11 +316,11 @@ sub handler {
 					}
 
 					my $start = time;
-					my $response = $aref->[2]->run( $aref->[0], @{$aref->[1]} );
+					my $response = $q_coderef->run( $q_appreq, @$q_args );
 					my $time = sprintf '%.3f', time - $start;
-					$log->debug(sub{return "Method duration for [".$aref->[2]->api_name." -> ".join(', ',@{$aref->[1]}).']:  '.$time }, DEBUG );
+					$log->debug(sub{return "Method duration for [".$q_coderef->api_name." -> ".join(', ',@$q_args).']:  '.$time }, DEBUG );
 
-					$appreq = $aref->[0];	
+					$appreq = $q_appreq;
 					$appreq->respond_complete( $response );
 					$log->debug(sub{return "Executed: " . $appreq->threadTrace }, INTERNAL );
 
@@ -317,7 +332,7 @@ sub handler {
 					$session->status(
 						OpenSRF::DomainObject::oilsMethodException->new(
 								statusCode => STATUS_INTERNALSERVERERROR(),
-								status => "Call to [".$aref->[2]->api_name."] faild:  $e"
+								status => "Call to [".$q_coderef->api_name."] faild:  $e"
 						)
 					);
 				};
@@ -427,6 +442,16 @@ sub register_method {
 	$args{server_class} = server_class();
 	$args{api_name} ||= $args{server_class} . '.' . $args{method};
 
+	# accidental re-registration of the same handler (module reloads,
+	# repeated imports) would re-parse the signature and rebuild the
+	# table entry for no change; keep the existing entry instead.
+	# registrations that point the api_name at a different handler
+	# still override as before.
+	my $existing = $_METHODS[$args{api_level}]{$args{api_name}};
+	return if ($existing
+		and $existing->{package} eq $args{package}
+		and $existing->{method} eq $args{method});
+
 	# un-if(0) this block to enable signature parsing
 	if (!$args{signature}) {
 		if ($args{notes} && !ref($args{notes})) {
@@ -446,21 +471,41 @@ sub register_method {
 	}
 
 	OpenSRF::Utils::JSON->register_class_hint(
-		strip => ['session'],
+		strip => ['session', '__coderef'],
 		name => $app,
 		hint => $args{object_hint},
 		type => "hash"
 	);
 
 	$_METHODS[$args{api_level}]{$args{api_name}} = bless \%args => $app;
-
-	__PACKAGE__->register_method(
-		stream => 0,
-		argc => $args{argc},
-		api_name => $args{api_name}.'.atomic',
-		method => 'make_stream_atomic',
-		notes => "This is a system generated method.  Please see the definition for $args{api_name}",
-	) if ($args{stream});
+	$_method_name_cache[$args{api_level}] = undef;
+
+	# system-generated .atomic variant for streaming methods.  build the
+	# table entry directly instead of recursing through the registration
+	# path above, which would re-parse a signature string and re-register
+	# the same class hint once per streaming method.
+	if ($args{stream}) {
+		my $notes = "This is a system generated method.  Please see the definition for $args{api_name}";
+		my %atomic_args = (
+			method => 'make_stream_atomic',
+			api_name => $args{api_name}.'.atomic',
+			api_level => 1,
+			stream => 0,
+			remote => 0,
+			argc => $args{argc},
+			package => __PACKAGE__,
+			server_class => server_class(),
+			object_hint => 'OpenSRF_Application',
+			notes => $notes,
+			signature => {
+				desc => $notes,
+				params => [],
+				'return' => { desc => undef, type => undef, class => undef },
+			},
+		);
+		$_METHODS[1]{$atomic_args{api_name}} = bless \%atomic_args => __PACKAGE__;
+		$_method_name_cache[1] = undef;
+	}
 }
 
 sub retrieve_remote_apis {
@@ -519,6 +564,7 @@ sub populate_remote_method_cache {
 			$method->{remote} = 1;
 			bless($method, __PACKAGE__ );
 			$_METHODS[$$method{api_level}]{$$method{api_name}} = $method;
+			$_method_name_cache[$$method{api_level}] = undef;
 		}
 
 		$req->finish;
@@ -547,17 +593,17 @@ sub method_lookup {
 	$log->debug("Lookup of [$method] by [$class] in api_level [$proto]", DEBUG);
 	$log->debug(sub{return "Available methods\n\t".join("\n\t", keys %{ $_METHODS[$proto] }) }, INTERNAL);
 
+	# a single hash fetch per level instead of an exists + fetch pair.
+	# in thunk mode the first hit walking up from api_level 1 is the
+	# same method the old full reverse scan settled on, so stop there.
 	my $meth;
 	if (__PACKAGE__->thunk) {
-		for my $p ( reverse(1 .. $proto) ) {
-			if (exists $_METHODS[$p]{$method}) {
-				$meth = $_METHODS[$p]{$method};
-			}
+		for my $p ( 1 .. $proto ) {
+			next unless $_METHODS[$p];
+			last if ($meth = $_METHODS[$p]{$method});
 		}
 	} else {
-		if (exists $_METHODS[$proto]{$method}) {
-			$meth = $_METHODS[$proto]{$method};
-		}
+		$meth = $_METHODS[$proto]{$method} if $_METHODS[$proto];
 	}
 
 	if (defined $meth) {
@@ -613,7 +659,12 @@ sub run {
 	}
 
 	if (!$self->{remote}) {
-		my $code = \&{$self->{package} . '::' . $self->{method}};
+		# resolving the symbolic ref means building the package::method
+		# string and walking the symbol table on every call.  method
+		# definitions are write-once, so resolve once and keep the
+		# coderef on the method object.
+		my $code = $self->{__coderef} ||=
+			\&{$self->{package} . '::' . $self->{method}};
 		my $err = undef;
 		my $warnhandler;
 
@@ -704,7 +755,9 @@ sub introspect {
 
 	my ($seen,$returned) = (0,0);
 	for my $api_level ( reverse(1 .. $#_METHODS) ) {
-		for my $api_name ( sort keys %{$_METHODS[$api_level]} ) {
+		my $names = $_method_name_cache[$api_level] ||=
+			[ sort keys %{$_METHODS[$api_level]} ];
+		for my $api_name ( @$names ) {
 			if (!$offset || $offset <= $seen) {
 				if (!$_METHODS[$api_level]{$api_name}{remote}) {
 					if (defined($method)) {
@@ -746,7 +799,6 @@ __PACKAGE__->register_method(
 	method => 'introspect',
 	argc => 1,
 	api_name => 'opensrf.system.method',
-	argc => 1,
 	signature => {
 		desc => q/Use this method to get the definition of a single OpenSRF Method/,
 		params => [
@@ -106,8 +106,6 @@ sub text_reverse {
 
     my $reversed_text = scalar reverse($text);
     return $reversed_text;
-    
-    return undef;
 }
 
 __PACKAGE__->register_method(
@@ -697,8 +697,8 @@ sub init {
     my $service = $self->{parent}->{service};
     $0 = "OpenSRF Drone [$service]";
     OpenSRF::Transport::PeerHandle->construct($service);
-    OpenSRF::Application->application_implementation->child_init
-        if (OpenSRF::Application->application_implementation->can('child_init'));
+    my $app = OpenSRF::Application->application_implementation;
+    $app->child_init if ($app->can('child_init'));
 }
 
 # ----------------------------------------------------------------
@@ -749,8 +749,8 @@ sub run {
 
     $chatty and $logger->internal("server: child process shutting down after reaching max_requests");
 
-    OpenSRF::Application->application_implementation->child_exit
-        if (OpenSRF::Application->application_implementation->can('child_exit'));
+    my $app = OpenSRF::Application->application_implementation;
+    $app->child_exit if ($app->can('child_exit'));
 }
 
 # ----------------------------------------------------------------
@@ -31,7 +31,7 @@ sub load_bootstrap_config {
         unless $bootstrap_config_file;
 
     OpenSRF::Utils::Config->load(config_file => $bootstrap_config_file);
-    OpenSRF::Utils::JSON->register_class_hint(name => "OpenSRF::Application", hint => "method", type => "hash", strip => ['session']);
+    OpenSRF::Utils::JSON->register_class_hint(name => "OpenSRF::Application", hint => "method", type => "hash", strip => ['session', '__coderef']);
     OpenSRF::Transport->message_envelope("OpenSRF::Transport::SlimJabber::MessageWrapper");
     OpenSRF::Transport::PeerHandle->set_peer_client("OpenSRF::Transport::SlimJabber::PeerConnection");
     OpenSRF::Application->server_class('client');
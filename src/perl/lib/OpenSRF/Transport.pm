@@ -46,11 +46,13 @@ level transport
 
 sub message_envelope {
 	my( $class, $envelope ) = @_;
-	if( $envelope ) {
+	if( $envelope and (!$message_envelope or $message_envelope ne $envelope) ) {
+		# only pay the UNIVERSAL::require string-eval when the
+		# envelope class actually changes
 		$message_envelope = $envelope;
 		$envelope->use;
 		if( $@ ) {
-			$logger->error( 
+			$logger->error(
 					"Error loading message_envelope: $envelope -> $@", ERROR);
 		}
 	}
@@ -70,7 +72,7 @@ sub handler {
 	my $start_time = time();
 	my( $class, $service, $data ) = @_;
 
-	$logger->transport( "Transport handler() received $data", INTERNAL );
+	$logger->transport( sub{return "Transport handler() received $data" }, INTERNAL );
 
 	my $remote_id	= $data->from;
 	my $sess_id	= $data->thread;
@@ -126,7 +128,7 @@ sub handler {
 		return 1;
 	}
 
-	$logger->transport( "Transport::handler() creating \n$body", INTERNAL );
+	$logger->transport( sub{return "Transport::handler() creating \n$body" }, INTERNAL );
 
 	# We need to disconnect the session if we got a jabber error on the client side.  For
 	# server side, we'll just tear down the session and go away.
@@ -29,6 +29,9 @@ classes capabilities.
 sub set_peer_client {
 	my( $class, $peer ) = @_;
 	if( $peer ) {
+		# already loaded and in place; avoid re-requiring the class
+		# and stacking duplicate @ISA entries
+		return if grep { $_ eq $peer } @ISA;
 		$peer->use;
 		if( $@ ) {
 			throw OpenSRF::EX::PANIC ( "Unable to set peer client: $@" );
@@ -23,7 +23,6 @@ Subclasses OpenSRF::Transport::SlimJabber::Client.
 
 =cut
 
-our %apps_hash;
 our $_singleton_connection;
 
 sub retrieve { 
@@ -79,10 +78,8 @@ sub new {
 	$self->app($app);
 
 	$_singleton_connection = $self;
-	$apps_hash{$app} = $self;
 
 	return $_singleton_connection;
-	return $apps_hash{$app};
 }
 
 sub process {
@@ -244,9 +244,13 @@ sub wait {
     my $nbytes;
     my $first_read = 1;
 
+    # hoist the lookups out of the read loop
+    my $parser = $self->{parser};
+    my $queue = $self->{queue};
+
     while($nbytes = sysread($socket, $buf, $read_size)) {
-        $self->{parser}->parse_more($buf) if $buf;
-        if($nbytes < $read_size or $self->peek_msg) {
+        $parser->parse_more($buf) if $buf;
+        if($nbytes < $read_size or @$queue) {
             set_block($socket) if $nonblock;
             last;
         }
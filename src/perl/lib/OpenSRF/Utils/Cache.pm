@@ -2,6 +2,15 @@ package OpenSRF::Utils::Cache;
 use strict; use warnings;
 use base qw/OpenSRF/;
 use Cache::Memcached;
+
+# prefer the libmemcached-backed client when it is installed; it speaks
+# the same new({servers=>...})/get/set/delete API but does its protocol
+# work in C.  fall back to the pure-perl Cache::Memcached otherwise.
+my $memcache_class = 'Cache::Memcached';
+eval {
+	require Cache::Memcached::Fast;
+	$memcache_class = 'Cache::Memcached::Fast';
+};
 use Digest::MD5 qw(md5_hex);
 use OpenSRF::Utils::Logger qw/:level/;
 use OpenSRF::Utils::Config;
@@ -93,7 +102,7 @@ sub new {
 
 	my $self = {};
 	$self->{persist} = $persist || 0;
-	$self->{memcache} = Cache::Memcached->new( { servers => $servers } ); 
+	$self->{memcache} = $memcache_class->new( { servers => $servers } );
 	if(!$self->{memcache}) {
 		throw OpenSRF::EX::PANIC ("Unable to create a new memcache object for $cache_type");
 	}
@@ -128,7 +137,9 @@ sub put_cache {
 		return undef;
 	}
 
-	$log->debug("Stored $key => $value in memcached server", INTERNAL);
+	# pass a sub so the full payload string is only built when
+	# INTERNAL logging is actually enabled
+	$log->debug(sub{return "Stored $key => $value in memcached server" }, INTERNAL);
 
 	if($self->{"persist"}) {
 
@@ -193,7 +204,7 @@ sub get_cache {
 
 	# if not in memcache but we are persisting, the put it into memcache
 	if( $self->{"persist"} ) {
-		$val = $persist_peek_stack->( "_CACHEVAL_$key" );
+		$val = $persist_peek_stack->run( "_CACHEVAL_$key" );
 		if(defined($val)) {
 			my ($expire) = $persist_slot_get_expire->run("_CACHEVAL_$key");
 			if($expire)	{
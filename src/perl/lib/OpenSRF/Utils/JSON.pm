@@ -4,6 +4,9 @@ use warnings;
 use strict;
 use JSON::XS;
 
+# a single XS parser instance, configured once at load time; every
+# encode/decode in the process reuses it rather than re-selecting or
+# re-configuring a backend per call
 our $parser = JSON::XS->new;
 $parser->ascii(1);        # output \u escaped strings for any char with a value over 127
 $parser->allow_nonref(1); # allows non-reference values to equate to themselves (see perldoc)
@@ -12,6 +15,31 @@ our %_class_map = ();
 our $JSON_CLASS_KEY = '__c';   # points to the classname of encoded objects
 our $JSON_PAYLOAD_KEY = '__p'; # same, for payload
 
+# memoized hint -> destination class resolutions for JSONObject2Perl
+my %_vivify_class_cache;
+
+# a second parser that blesses class-hinted objects as the decoder
+# builds them, fusing rawJSON2perl + JSONObject2Perl into one pass; the
+# filter runs bottom-up, so payloads are already vivified when their
+# wrapper is seen
+our $vivifier = JSON::XS->new;
+$vivifier->ascii(1);
+$vivifier->allow_nonref(1);
+$vivifier->filter_json_object(\&_vivify_wrapper);
+
+sub _vivify_wrapper {
+    my $class = $_[0]->{$JSON_CLASS_KEY};
+    return unless defined $class;    # plain hash; keep as-is
+    my $vivobj = $_[0]->{$JSON_PAYLOAD_KEY};
+    return undef unless defined $vivobj;
+    $class = $_vivify_class_cache{$class} //= do {
+        (my $c = $class) =~ s/^\s+|\s+$//g;
+        __PACKAGE__->lookup_class($c) || $c;
+    };
+    return bless(\$vivobj, $class) unless ref $vivobj;
+    return bless($vivobj, $class);
+}
+
 
 
 =head1 NAME
@@ -57,8 +85,17 @@ sub register_class_hint {
     # FIXME maybe not just store a reference to %args; the lookup
     # functions are really confusing at first glance as a side effect
     # of this
+
+    # precompute the strip-key lookup set once at registration, so
+    # perl2JSONObject doesn't rebuild it for every instance of the class
+    $args{strip_map} = { map { $_ => 1 } @{$args{strip}} } if $args{strip};
+
     $_class_map{hints}{$args{hint}} = \%args;
     $_class_map{classes}{$args{name}} = \%args;
+
+    # a hint may have been seen (and cached as unmapped) before its
+    # registration; drop stale resolutions
+    %_vivify_class_cache = ();
 }
 
 
@@ -70,10 +107,11 @@ that string.
 =cut
 
 sub JSON2perl {
-    # FIXME $string is not checked for any criteria, even existance
     my( $pkg, $string ) = @_;
-    my $perl = $pkg->rawJSON2perl($string);
-    return $pkg->JSONObject2Perl($perl);
+    return undef unless (defined $string and $string =~ /\S/o);
+    # decode and vivify in a single pass; see $vivifier above.
+    # JSONObject2Perl remains for callers holding already-decoded data
+    return $vivifier->decode($string);
 }
 
 
@@ -144,30 +182,38 @@ sub JSONObject2Perl {
     # if $obj is a hash
     if ( ref $obj eq 'HASH' ) {
         # and if it has the "I'm a class!" marker
-        if ( defined $obj->{$JSON_CLASS_KEY} ) {
+        if ( defined( my $class = $obj->{$JSON_CLASS_KEY} ) ) {
             # vivify the payload
             my $vivobj = $pkg->JSONObject2Perl($obj->{$JSON_PAYLOAD_KEY});
             return undef unless defined $vivobj;
 
-            # and bless it back into an object
-            my $class = $obj->{$JSON_CLASS_KEY};
-            $class =~ s/^\s+//; # FIXME pretty sure these lines could condense to 's/\s+//g'
-            $class =~ s/\s+$//;
-            $class = $pkg->lookup_class($class) if $pkg->lookup_class($class);
+            # and bless it back into an object.  resolving a hint costs
+            # a trim regex plus a registry probe, and result sets repeat
+            # the same hint thousands of times, so memoize the answer
+            $class = $_vivify_class_cache{$class} //= do {
+                (my $c = $class) =~ s/^\s+|\s+$//g;
+                $pkg->lookup_class($c) || $c;
+            };
             return bless(\$vivobj, $class) unless ref $vivobj;
             return bless($vivobj, $class);
         }
 
-        # is a hash, but no class marker; simply revivify innards
+        # is a hash, but no class marker; simply revivify innards.
+        # plain scalars come back from the recursion untouched, so
+        # don't bother descending into them at all
         for my $k (keys %$obj) {
-            $obj->{$k} = $pkg->JSONObject2Perl($obj->{$k})
-              unless JSON::XS::is_bool $obj->{$k};
+            my $v = $obj->{$k};
+            next unless ref $v;
+            $obj->{$k} = $pkg->JSONObject2Perl($v)
+              unless JSON::XS::is_bool $v;
         }
     } elsif ( ref $obj eq 'ARRAY' ) {
-        # not a hash; an array. revivify.
+        # not a hash; an array. revivify, skipping scalar leaves as above.
         for my $i (0..scalar(@$obj) - 1) {
-            $obj->[$i] = $pkg->JSONObject2Perl($obj->[$i])
-              unless JSON::XS::is_bool $obj->[$i];
+            my $v = $obj->[$i];
+            next unless ref $v;
+            $obj->[$i] = $pkg->JSONObject2Perl($v)
+              unless JSON::XS::is_bool $v;
               # FIXME? This does nothing except leave any Booleans in
               # place, without recursively calling this sub on
               # them. I'm not sure if that's what's supposed to
@@ -210,19 +256,24 @@ sub perl2JSONObject {
 
     my $jsonobj;
 
-    if(UNIVERSAL::isa($obj, 'HASH')) {
+    # test the reftype directly first; plain hashes and arrays (the
+    # common case on the wire) skip the UNIVERSAL::isa call entirely
+    if($ref eq 'HASH' or UNIVERSAL::isa($obj, 'HASH')) {
         $jsonobj = {};
+        # the strip-key set is precomputed at registration time; grab
+        # the cached map rather than rebuilding it per instance
+        my $strip = $ref ne 'HASH' ? $_class_map{classes}{$ref}{strip_map} : undef;
+        # scalar members pass through the recursion unchanged, so copy
+        # them directly and only descend into references
         for my $k (keys %$obj) {
-            next if (
-                $ref ne 'HASH'
-                and exists $_class_map{classes}{$ref}{strip}
-                and grep { $k eq $_ } @{$_class_map{classes}{$ref}{strip}}
-            );
-            $jsonobj->{$k} = $pkg->perl2JSONObject($obj->{$k});
+            next if $strip and exists $strip->{$k};
+            my $v = $obj->{$k};
+            $jsonobj->{$k} = ref($v) ? $pkg->perl2JSONObject($v) : $v;
         }
     } elsif(UNIVERSAL::isa($obj, 'ARRAY')) {
         $jsonobj = [];
-        $jsonobj->[$_] = $pkg->perl2JSONObject($obj->[$_]) for(0..scalar(@$obj) - 1);
+        $jsonobj->[$_] = ref($obj->[$_]) ? $pkg->perl2JSONObject($obj->[$_]) : $obj->[$_]
+            for(0..scalar(@$obj) - 1);
     }
 
     if($ref ne 'HASH' and $ref ne 'ARRAY') {
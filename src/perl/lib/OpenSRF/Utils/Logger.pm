@@ -56,6 +56,17 @@ sub ALL      { return 100; }
 
 my $isclient;  # true if we control the osrf_xid
 
+# map each log level to its syslog priority and message tag, rather
+# than walking an if-chain on every message
+my %level_info = (
+    ERROR()    => [ LOG_ERR,     "ERR " ],
+    WARN()     => [ LOG_WARNING, "WARN" ],
+    INFO()     => [ LOG_INFO,    "INFO" ],
+    DEBUG()    => [ LOG_DEBUG,   "DEBG" ],
+    INTERNAL() => [ LOG_DEBUG,   "INTL" ],
+    ACTIVITY() => [ LOG_INFO,    "ACT"  ],
+);
+
 # load up our config options
 sub set_config {
     my $force = shift;
@@ -239,63 +250,97 @@ sub _log_message {
     my( $msg, $level ) = @_;
     return if $level > $loglevel;
 
+    # make sure the config (and the logging flags below) are loaded
+    # once, rather than re-probing via is_syslog()/is_filelog() wrappers
+    # for every message
+    set_config();
+
     # Allow $msg to be either a normal string or a delayed exec subroutine
     $msg = &$msg if (ref($msg) eq 'CODE');
 
     # apply a sane default service name/tag
     $logger->set_service($0) unless $service;
 
-    my $l; my $n; 
-    my $fac = $facility;
-
-    if ($level == ERROR())            {$l = LOG_ERR; $n = "ERR "; }
-    elsif ($level == WARN())        {$l = LOG_WARNING; $n = "WARN"; }
-    elsif ($level == INFO())        {$l = LOG_INFO; $n = "INFO"; }    
-    elsif ($level == DEBUG())        {$l = LOG_DEBUG; $n = "DEBG"; }
-    elsif ($level == INTERNAL())    {$l = LOG_DEBUG; $n = "INTL"; }
-    elsif ($level == ACTIVITY())    {$l = LOG_INFO; $n = "ACT"; $fac = $actfac; }
+    my $fac = $level == ACTIVITY() ? $actfac : $facility;
+    my( $l, $n ) = @{ $level_info{$level} || [] };
 
     my( undef, $file, $line_no ) = caller(1);
-   $file =~ s#/.*/##og;
+    # basename only; rindex+substr beats firing up the regex engine
+    # for every message
+    my $slash = rindex( $file, '/' );
+    $file = substr( $file, $slash + 1 ) if $slash >= 0;
 
     # help syslog with the formatting
-    $msg =~ s/\%/\%\%/gso if( is_act_syslog() or is_syslog() );
+    $msg =~ s/\%/\%\%/gso if( $act_syslog_enabled or $syslog_enabled );
 
-    $msg = "[$n:"."$$".":$file:$line_no:$osrf_xid] $msg";
+    # one interpolation pass builds the whole prefix
+    $msg = "[$n:$$:$file:$line_no:$osrf_xid] $msg";
 
     # Trim the message to the configured maximum log message length
-    $msg = substr($msg, 0, $max_log_msg_len); 
+    $msg = substr($msg, 0, $max_log_msg_len) if length($msg) > $max_log_msg_len;
 
     # avoid clobbering the adopted syslog facility
     my $slog_flags = $ENV{OSRF_ADOPT_SYSLOG} ? $l : $fac | $l;
 
     if( $level == ACTIVITY() ) {
-        if( is_act_syslog() ) { syslog( $slog_flags, $msg ); }
-        elsif( is_act_filelog() ) { _write_file( $msg, 1 ); }
+        if( $act_syslog_enabled ) { syslog( $slog_flags, $msg ); }
+        elsif( $act_logfile_enabled ) { _write_file( $msg, 1 ); }
 
     } else {
-        if( is_syslog() ) { syslog( $slog_flags, $msg ); }
-        elsif( is_filelog() ) { _write_file($msg); }
+        if( $syslog_enabled ) { syslog( $slog_flags, $msg ); }
+        elsif( $logfile_enabled ) { _write_file($msg); }
     }
 
     return $msg;
 }
 
+# cache of open log file handles, so each message is a single write
+# instead of an open/write/close cycle
+my %sink_cache;
+
+# the timestamp only changes once a second; remember the last one
+# formatted instead of running localtime+sprintf per message
+my $stamp_time = -1;
+my $stamp = '';
+
 sub _write_file {
     my ($msg, $isact) = @_;
     my $file = $isact ? $actfile : $logfile;
-    my ($sec,$min,$hour,$mday,$mon,$year,$wday,$yday,$isdst) = localtime(time);  
-    $year += 1900; $mon += 1;
 
+    my $now = time;
+    if ($now != $stamp_time) {
+        my ($sec,$min,$hour,$mday,$mon,$year) = localtime($now);
+        $stamp = sprintf("[%04d-%02d-%02d %02d:%02d:%02d]",
+            $year + 1900, $mon + 1, $mday, $hour, $min, $sec);
+        $stamp_time = $now;
+    }
+
+    my $fh;
     if ($file) {
-        sysopen( SINK, $file, O_NONBLOCK|O_WRONLY|O_APPEND|O_CREAT ) 
-            or die "Cannot sysopen $file: $!";
+        $fh = $sink_cache{$file};
+        if ($fh) {
+            # reopen if the path no longer names the open file -- i.e.
+            # the log has been rotated out from under us
+            my @fstat = stat($fh);
+            my @pstat = stat($file);
+            unless (@pstat and $fstat[0] == $pstat[0] and $fstat[1] == $pstat[1]) {
+                close($fh);
+                $fh = undef;
+            }
+        }
+        unless ($fh) {
+            sysopen( $fh, $file, O_NONBLOCK|O_WRONLY|O_APPEND|O_CREAT )
+                or die "Cannot sysopen $file: $!";
+            binmode($fh, ':utf8');
+            $fh->autoflush(1);
+            $sink_cache{$file} = $fh;
+        }
     } else {
-        open (SINK, ">&2");  # print to STDERR as warned
+        open ($fh, ">&2");  # print to STDERR as warned
+        binmode($fh, ':utf8');
     }
-    binmode(SINK, ':utf8');
-    printf SINK "[%04d-%02d-%02d %02d:%02d:%02d] %s %s\n", $year, $mon, $mday, $hour, $min, $sec, $service, $msg;
-    close( SINK );
+    print $fh "$stamp $service $msg\n";
+    close( $fh ) unless $file;
 }
 
 1;
@@ -28,20 +28,17 @@ sub config_value {
 
 	my $hash = $host_config;
 
-	# XXX TO DO, check local config 'version', 
+	# XXX TO DO, check local config 'version',
 	# call out to settings server when necessary....
-	try {
-		for my $key (@keys) {
-			if(!ref($hash) eq 'HASH'){
-				return undef;
-			}
-			$hash = $hash->{$key};
-		}
 
-	} catch Error with {
-		my $e = shift;
-		throw OpenSRF::EX::Config ("No Config information for @keys : $e : $@");
-	};
+	# walk the cached config hash directly.  the old version wrapped
+	# this loop in try/catch, paying for two closures per lookup, and
+	# its "!ref($hash) eq 'HASH'" guard never fired thanks to operator
+	# precedence -- a plain ref check is both correct and cheaper.
+	for my $key (@keys) {
+		return undef unless ref($hash) eq 'HASH';
+		$hash = $hash->{$key};
+	}
 
 	return $hash;
 
@@ -842,11 +842,8 @@ int send_request( const char* server,
 				char* content;
 	
 				if( pretty_print ) {
-					char* j = jsonObjectToJSON(omsg->_result_content);
-					if( j ) {
-						content = jsonFormatString(j);
-						free(j);
-					} else
+					content = jsonObjectToJSONPretty(omsg->_result_content);
+					if( ! content )
 						content = strdup( "(null)" );
 				} else {
 					content = jsonObjectToJSON(omsg->_result_content);
@@ -880,11 +877,8 @@ int send_request( const char* server,
 				char* content;
 	
 				if( pretty_print && omsg->_result_content ) {
-					char* j = jsonObjectToJSON(omsg->_result_content);
-					if( j ) {
-						content = jsonFormatString(j);
-						free(j);
-					} else
+					content = jsonObjectToJSONPretty(omsg->_result_content);
+					if( ! content )
 						content = strdup( "(null)" );
 				} else {
 					content = jsonObjectToJSON(omsg->_result_content);